@@ -1,6 +1,14 @@
 import json
 import csv
 import re
+import os
+import glob
+import hashlib
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from pvp_index import write_binary_index
 
 # --------- Inputs
 INPUT_STORE = "javelindata_pvp_store_v2.json"
@@ -16,6 +24,12 @@ INPUT_ENUS    = "en-us.json"                     # localization: keys like "ui_e
 INPUT_EMOTES  = "javelindata_emotedefinitions.json"
 
 OUTPUT_JS = "data.js"
+OUTPUT_INDEX = "data.idx"                      # mmap-able index for pvp_index.py
+OUTPUT_PLAN_JS = "plan.js"                     # pvp_planner.py --out, loaded by index.html
+SEASON_MANIFEST = "seasons.json"
+
+# per-season dumps name the item CSV after the season (exportItemsNamesS10.csv, ...)
+ITEMCSV_GLOB = "exportItemsNames*.csv"
 
 CDN_PREFIX = "https://cdn.nw-buddy.de/nw-data/live/"
 
@@ -86,40 +100,33 @@ def safe_int(v, default=0):
         except Exception:
             return default
 
+def load_json(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
 
-# --------- LOAD RAW FILES
-
-with open(INPUT_STORE, "r", encoding="utf-8") as f:
-    store_rows = json.load(f)
-
-with open(INPUT_REWARDS, "r", encoding="utf-8") as f:
-    reward_rows = json.load(f)
-
-with open(INPUT_LOOTTABLES, "r", encoding="utf-8") as f:
-    loot_rows = json.load(f)
-
-with open(INPUT_LOOTBUCKETS, "r", encoding="utf-8") as f:
-    lootbuckets_rows = json.load(f)
-
-with open(INPUT_HOUSING, "r", encoding="utf-8") as f:
-    housing_rows = json.load(f)
-
-with open(INPUT_GAMEEVENTS, "r", encoding="utf-8") as f:
-    gameevents_rows = json.load(f)
-
-with open(INPUT_ENUS, "r", encoding="utf-8") as f:
-    en_us_raw = json.load(f)
+def file_digest(path: str) -> str:
+    """
+    sha1 of a file's bytes, used to detect identical catalogs across seasons.
+    """
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
 
-with open(INPUT_EMOTES, "r", encoding="utf-8") as f:
-    emote_defs = json.load(f)
 
-# also read CSV for items / rarity / icons
-with open(INPUT_ITEMCSV, "r", encoding="utf-8", newline="") as fcsv:
-    csv_reader = csv.DictReader(fcsv)
-    itemcsv_rows = list(csv_reader)
+# --------- LOOKUPS
+# The helpers below read these as module globals. They are (re)filled by
+# install_catalogs() and build_season(), one season at a time per process.
 
-# build lowercase lookup for en-us
-en_us_lower = {k.lower(): v for k, v in en_us_raw.items()}
+en_us_lower = {}
+catalog_by_id_lower = {}
+catalog_by_name_lower = {}
+housing_by_id_lower = {}
+emote_icon_by_key = {}
+emote_prettyname_by_key = {}
+gameevent_by_id = {}
+rows_by_loot_id = {}
 
 
 # --------- TEXT / LOCALIZATION HELPERS
@@ -167,86 +174,159 @@ def resolve_localized_name(raw: str) -> str:
 
 # --------- BUILD CATALOGS (item CSV, emotes, housing)
 
-# item CSV -> build:
-#   - catalog_by_id_lower:  itemId.lower() -> {name, icon, rarity}
-#   - catalog_by_name_lower: prettyName.lower() -> {name, icon, rarity}
-catalog_by_id_lower = {}
-catalog_by_name_lower = {}
+def load_catalogs(enus_path: str, itemcsv_path: str, housing_path: str,
+                  keys=None, cache=None):
+    """
+    Parse the season-independent catalogs (localization, item CSV, housing)
+    and install them for the current process.
+    With `keys` (from catalog_keys) each piece already in `cache` is reused
+    as is, and the pieces parsed here are added to it.
+    Returns a plain dict so it can be cached / shared between seasons.
+    """
+    global en_us_lower
+
+    def piece(name, parse):
+        key = keys[name] if keys else None
+        if cache is not None and key in cache:
+            return cache[key]
+        value = parse()
+        if cache is not None and key is not None:
+            cache[key] = value
+        return value
+
+    # en-us first: the CSV / housing names resolve through it
+    en_us_lower = piece("enus", lambda: parse_en_us(enus_path))
+    catalog_by_id_lower, catalog_by_name_lower = piece(
+        "itemcsv", lambda: parse_item_csv(itemcsv_path))
+    housing_by_id_lower = piece("housing", lambda: parse_housing(housing_path))
+
+    catalogs = {
+        "en_us_lower": en_us_lower,
+        "catalog_by_id_lower": catalog_by_id_lower,
+        "catalog_by_name_lower": catalog_by_name_lower,
+        "housing_by_id_lower": housing_by_id_lower,
+    }
+    install_catalogs(catalogs)
+    return catalogs
 
-for row in itemcsv_rows:
-    item_id_raw = (row.get("Item ID") or row.get("ItemID") or "").strip()
-    raw_name = (row.get("Name") or "").strip()
-    rarity = (row.get("Rarity") or "").strip()          # Artifact / Legendary / etc.
-    icon_rel = (row.get("Icon Path") or row.get("IconPath") or "").strip()
 
-    pretty_name = resolve_localized_name(raw_name) or item_id_raw
-    icon_full = full_icon(icon_rel)
+def parse_en_us(enus_path: str):
+    en_us_raw = load_json(enus_path)
+    # build lowercase lookup for en-us (needed to resolve CSV / housing names)
+    return {k.lower(): v for k, v in en_us_raw.items()}
 
-    rec = {
-        "id": item_id_raw,
-        "name": pretty_name,
-        "icon": icon_full,
-        "rarity": rarity.lower() if rarity else "",
-    }
 
-    if item_id_raw:
-        catalog_by_id_lower[item_id_raw.lower()] = rec
-    catalog_by_name_lower[rec["name"].lower()] = rec
+def parse_item_csv(itemcsv_path: str):
+    """Item CSV -> (catalog_by_id_lower, catalog_by_name_lower). Needs en-us installed."""
+    with open(itemcsv_path, "r", encoding="utf-8", newline="") as fcsv:
+        csv_reader = csv.DictReader(fcsv)
+        itemcsv_rows = list(csv_reader)
 
+    # item CSV -> build:
+    #   - catalog_by_id_lower:  itemId.lower() -> {name, icon, rarity}
+    #   - catalog_by_name_lower: prettyName.lower() -> {name, icon, rarity}
+    catalog_by_id_lower = {}
+    catalog_by_name_lower = {}
 
-# emote data
-# emote_prettyname_by_key["ui_emote_frustrated_name"] -> "Frustrated"
-# emote_icon_by_key["ui_emote_frustrated_name"] -> full icon URL
-emote_icon_by_key = {}
-emote_prettyname_by_key = {}
+    for row in itemcsv_rows:
+        item_id_raw = (row.get("Item ID") or row.get("ItemID") or "").strip()
+        raw_name = (row.get("Name") or "").strip()
+        rarity = (row.get("Rarity") or "").strip()          # Artifact / Legendary / etc.
+        icon_rel = (row.get("Icon Path") or row.get("IconPath") or "").strip()
 
-for e in emote_defs:
-    disp_key = (e.get("DisplayName") or "").strip()  # e.g. "ui_emote_Frustrated_name"
-    if not disp_key:
-        continue
-    k = disp_key.lower()
+        pretty_name = resolve_localized_name(raw_name) or item_id_raw
+        icon_full = full_icon(icon_rel)
 
-    # resolve display name via en-us, fallback to humanized
-    if k in en_us_lower:
-        pretty = en_us_lower[k]
-    elif k.endswith("_name") and k[:-5] in en_us_lower:
-        pretty = en_us_lower[k[:-5]]
-    else:
-        pretty = humanize_from_key(k)
+        rec = {
+            "id": item_id_raw,
+            "name": pretty_name,
+            "icon": icon_full,
+            "rarity": rarity.lower() if rarity else "",
+        }
 
-    icon_path = e.get("UiImage") or ""
-    emote_icon_by_key[k] = full_icon(icon_path)
-    emote_prettyname_by_key[k] = pretty
+        if item_id_raw:
+            catalog_by_id_lower[item_id_raw.lower()] = rec
+        catalog_by_name_lower[rec["name"].lower()] = rec
 
+    return catalog_by_id_lower, catalog_by_name_lower
 
-# housing items:
-# HouseItemID / Name(@House_..._MasterName) / IconPath
-housing_by_id_lower = {}
-for h in housing_rows:
-    hid = (h.get("HouseItemID") or "").strip()
-    raw_loc_name = (h.get("Name") or "").strip()  # ex: "@House_Season5_PVP_shelf_MasterName"
-    pretty_name = resolve_localized_name(raw_loc_name) or hid
 
-    icon_path = h.get("IconPath") or ""
-    icon_full = full_icon(icon_path)
+def parse_housing(housing_path: str):
+    """Housing catalog -> housing_by_id_lower. Needs en-us installed."""
+    housing_rows = load_json(housing_path)
 
-    rarity_val = (h.get("ItemRarity") or "").strip().lower()
+    # housing items:
+    # HouseItemID / Name(@House_..._MasterName) / IconPath
+    housing_by_id_lower = {}
+    for h in housing_rows:
+        hid = (h.get("HouseItemID") or "").strip()
+        raw_loc_name = (h.get("Name") or "").strip()  # ex: "@House_Season5_PVP_shelf_MasterName"
+        pretty_name = resolve_localized_name(raw_loc_name) or hid
 
-    if hid:
-        housing_by_id_lower[hid.lower()] = {
-            "id": hid,
-            "name": pretty_name,
-            "icon": icon_full,
-            "rarity": rarity_val,
-        }
- 
-# game events:
-# on map chaque EventID -> sa ligne complète pour récupérer les quantités
-gameevent_by_id = {}
-for ge in gameevents_rows:
-    geid = (ge.get("EventID") or ge.get("EventId") or "").strip()
-    if geid:
-        gameevent_by_id[geid] = ge
+        icon_path = h.get("IconPath") or ""
+        icon_full = full_icon(icon_path)
+
+        rarity_val = (h.get("ItemRarity") or "").strip().lower()
+
+        if hid:
+            housing_by_id_lower[hid.lower()] = {
+                "id": hid,
+                "name": pretty_name,
+                "icon": icon_full,
+                "rarity": rarity_val,
+            }
+
+    return housing_by_id_lower
+
+
+def install_catalogs(catalogs):
+    """
+    Make a (possibly cached) catalog dict the active lookups for this process.
+    """
+    global en_us_lower, catalog_by_id_lower, catalog_by_name_lower, housing_by_id_lower
+    en_us_lower = catalogs["en_us_lower"]
+    catalog_by_id_lower = catalogs["catalog_by_id_lower"]
+    catalog_by_name_lower = catalogs["catalog_by_name_lower"]
+    housing_by_id_lower = catalogs["housing_by_id_lower"]
+
+
+def build_emote_maps(emote_defs):
+    """
+    emote_prettyname_by_key["ui_emote_frustrated_name"] -> "Frustrated"
+    emote_icon_by_key["ui_emote_frustrated_name"] -> full icon URL
+    """
+    emote_icon_by_key = {}
+    emote_prettyname_by_key = {}
+
+    for e in emote_defs:
+        disp_key = (e.get("DisplayName") or "").strip()  # e.g. "ui_emote_Frustrated_name"
+        if not disp_key:
+            continue
+        k = disp_key.lower()
+
+        # resolve display name via en-us, fallback to humanized
+        if k in en_us_lower:
+            pretty = en_us_lower[k]
+        elif k.endswith("_name") and k[:-5] in en_us_lower:
+            pretty = en_us_lower[k[:-5]]
+        else:
+            pretty = humanize_from_key(k)
+
+        icon_path = e.get("UiImage") or ""
+        emote_icon_by_key[k] = full_icon(icon_path)
+        emote_prettyname_by_key[k] = pretty
+
+    return emote_icon_by_key, emote_prettyname_by_key
+
+
+def build_gameevent_index(gameevents_rows):
+    # on map chaque EventID -> sa ligne complète pour récupérer les quantités
+    gameevent_by_id = {}
+    for ge in gameevents_rows:
+        geid = (ge.get("EventID") or ge.get("EventId") or "").strip()
+        if geid:
+            gameevent_by_id[geid] = ge
+    return gameevent_by_id
 
 
 
@@ -302,38 +382,36 @@ def resolve_icon_and_rarity(reward_name_field: str, raw_item_id: str):
 
 # --------- 1) Build PVP_DATA
 
-# collect all rows from the store with notch info
-long_rows = []
-for row in store_rows:
-    rowname = row.get("RowPlaceholders", "")
-    for notch_idx in (1, 2, 3):
-        reward_id = row.get(f"RewardId{notch_idx}") or row.get(f"RewardID{notch_idx}") or ""
-        if not reward_id:
-            continue
-        weight = int(row.get(f"RandomWeights{notch_idx}", 0) or 0)
-        if weight <= 0:
-            continue
-
-        bucket_name = row.get(f"Bucket{notch_idx}", "")
-        select_once = bool(row.get(f"SelectOnceOnly{notch_idx}", False))
-        exclude_cat = row.get(f"ExcludeTypeStage{notch_idx}", "")
-
-        long_rows.append({
-            "notch": notch_idx,
-            "bucket": bucket_name,
-            "rewardId": reward_id,
-            "weight": weight,
-            "selectOnceOnly": select_once,
-            "excludeTypeStage": exclude_cat,
-            "rowName": rowname,
-        })
+def build_long_rows(store_rows):
+    """
+    Collect all rows from the store with notch info.
+    """
+    long_rows = []
+    for row in store_rows:
+        rowname = row.get("RowPlaceholders", "")
+        for notch_idx in (1, 2, 3):
+            reward_id = row.get(f"RewardId{notch_idx}") or row.get(f"RewardID{notch_idx}") or ""
+            if not reward_id:
+                continue
+            weight = int(row.get(f"RandomWeights{notch_idx}", 0) or 0)
+            if weight <= 0:
+                continue
+
+            bucket_name = row.get(f"Bucket{notch_idx}", "")
+            select_once = bool(row.get(f"SelectOnceOnly{notch_idx}", False))
+            exclude_cat = row.get(f"ExcludeTypeStage{notch_idx}", "")
+
+            long_rows.append({
+                "notch": notch_idx,
+                "bucket": bucket_name,
+                "rewardId": reward_id,
+                "weight": weight,
+                "selectOnceOnly": select_once,
+                "excludeTypeStage": exclude_cat,
+                "rowName": rowname,
+            })
 
-# mark rewards that behave like "unique collectibles" (artifact / cosmetics etc.)
-artifact_like_map = {}
-for lr in long_rows:
-    rid = lr["rewardId"]
-    is_artifact = "artifact" in (lr.get("excludeTypeStage") or "").lower()
-    artifact_like_map[rid] = artifact_like_map.get(rid, False) or is_artifact
+    return long_rows
 
 
 def add_entry(store, level, notch, rewards_here):
@@ -361,18 +439,55 @@ def add_entry(store, level, notch, rewards_here):
     }
 
 
-PVP_DATA = {}
-# precompute for levels 0..230 (front clamp to 200 anyway)
-for lvl in range(0, 231):
-    for notch in (1, 2, 3):
-        possible = [r for r in long_rows
-                    if r["notch"] == notch and bucket_applies(r["bucket"], lvl)]
-        add_entry(PVP_DATA, lvl, notch, possible)
+def build_pvp_data(long_rows):
+    PVP_DATA = {}
+    # precompute for levels 0..230 (front clamp to 200 anyway)
+    for lvl in range(0, 231):
+        for notch in (1, 2, 3):
+            possible = [r for r in long_rows
+                        if r["notch"] == notch and bucket_applies(r["bucket"], lvl)]
+            add_entry(PVP_DATA, lvl, notch, possible)
+    return PVP_DATA
 
 
-# --------- 2) Loot tables (LTID) structures
+def build_owned_index(PVP_DATA, PVP_REWARD_META):
+    """
+    What the page needs to reweight a notch incrementally when an owned
+    checkbox is toggled (instead of refiltering the whole notch):
+      levelClass[lvl]      -> class id (levels with identical notch pools share one)
+      totals[cls]          -> [totalWeight notch1, notch2, notch3]
+      unique[rewardId]     -> [[cls, notch, weight], ...] for uniqueEligible rewards
+                              (one entry per notch, duplicate rows summed)
+    """
+    class_by_sig = {}
+    level_class = []
+    totals = []
+    unique = {}
+
+    for lvl in sorted(PVP_DATA, key=int):
+        notches = PVP_DATA[lvl]
+        sig = tuple(
+            tuple((r["rewardId"], r["weight"], r["selectOnceOnly"])
+                  for r in notches.get(str(n), {}).get("rewards", []))
+            for n in (1, 2, 3)
+        )
+        cls = class_by_sig.get(sig)
+        if cls is None:
+            cls = class_by_sig[sig] = len(totals)
+            totals.append([notches.get(str(n), {}).get("totalWeight", 0) for n in (1, 2, 3)])
+            for n, rows in enumerate(sig, start=1):
+                notch_w = {}
+                for rid, w, _ in rows:
+                    if PVP_REWARD_META.get(rid, {}).get("uniqueEligible"):
+                        notch_w[rid] = notch_w.get(rid, 0) + w
+                for rid, w in notch_w.items():
+                    unique.setdefault(rid, []).append([cls, n, w])
+        level_class.append(cls)
+
+    return {"levelClass": level_class, "totals": totals, "unique": unique}
 
-rows_by_loot_id = {row["LootTableID"]: row for row in loot_rows}
+
+# --------- 2) Loot tables (LTID) structures
 
 def build_loot_table_struct(table_id: str):
     """
@@ -458,121 +573,133 @@ def build_loot_roll_contents(table_id: str):
     }
 
 
-PVP_LOOT_TABLES = {}
-PVP_LOOT_CONTENTS = {}
+def build_loot_tables():
+    """
+    Tier structures + roll contents for every table in rows_by_loot_id
+    (the _Qty / _Probs companion rows are folded into their parent).
+    """
+    PVP_LOOT_TABLES = {}
+    PVP_LOOT_CONTENTS = {}
+
+    for tid in rows_by_loot_id.keys():
+        if tid.endswith("_Qty") or tid.endswith("_Probs"):
+            continue
+        PVP_LOOT_TABLES[tid] = build_loot_table_struct(tid)
+        PVP_LOOT_CONTENTS[tid] = build_loot_roll_contents(tid)
 
-for tid in rows_by_loot_id.keys():
-    if tid.endswith("_Qty") or tid.endswith("_Probs"):
-        continue
-    PVP_LOOT_TABLES[tid] = build_loot_table_struct(tid)
-    PVP_LOOT_CONTENTS[tid] = build_loot_roll_contents(tid)
+    return PVP_LOOT_TABLES, PVP_LOOT_CONTENTS
 
 
 # --------- 3) Bucket contents (LBID -> final item list)
 
-# lootbuckets sheet works as:
-# FIRSTROW row says: LootBucket1="PerkCharmMats_All", LootBucket2="PerkCharm", etc.
-firstrow_lb = next(
-    (r for r in lootbuckets_rows if (r.get("RowPlaceholders") or "").upper() == "FIRSTROW"),
-    None
-)
-
-idx_to_bucket = {}
-if firstrow_lb:
-    for k, v in firstrow_lb.items():
-        if isinstance(k, str) and k.startswith("LootBucket"):
-            idx = k.replace("LootBucket", "")
-            idx_to_bucket[idx] = v
-
-bucket_contents = {b: [] for b in idx_to_bucket.values()}
-
-for row in lootbuckets_rows:
-    for idx, bucket_name in idx_to_bucket.items():
-        item_key = f"Item{idx}"
-        qty_key = f"Quantity{idx}"
-        tags_key = f"Tags{idx}"
-
-        if item_key in row and row[item_key]:
-            tags_val = row.get(tags_key, [])
-            if isinstance(tags_val, str):
-                tags_val = [tags_val]
-
-            bucket_contents[bucket_name].append({
-                "itemId": row[item_key],
-                "qty": row.get(qty_key, None),
-                "tags": tags_val or [],
-            })
+def build_bucket_contents(lootbuckets_rows):
+    # lootbuckets sheet works as:
+    # FIRSTROW row says: LootBucket1="PerkCharmMats_All", LootBucket2="PerkCharm", etc.
+    firstrow_lb = next(
+        (r for r in lootbuckets_rows if (r.get("RowPlaceholders") or "").upper() == "FIRSTROW"),
+        None
+    )
+
+    idx_to_bucket = {}
+    if firstrow_lb:
+        for k, v in firstrow_lb.items():
+            if isinstance(k, str) and k.startswith("LootBucket"):
+                idx = k.replace("LootBucket", "")
+                idx_to_bucket[idx] = v
+
+    bucket_contents = {b: [] for b in idx_to_bucket.values()}
+
+    for row in lootbuckets_rows:
+        for idx, bucket_name in idx_to_bucket.items():
+            item_key = f"Item{idx}"
+            qty_key = f"Quantity{idx}"
+            tags_key = f"Tags{idx}"
+
+            if item_key in row and row[item_key]:
+                tags_val = row.get(tags_key, [])
+                if isinstance(tags_val, str):
+                    tags_val = [tags_val]
+
+                bucket_contents[bucket_name].append({
+                    "itemId": row[item_key],
+                    "qty": row.get(qty_key, None),
+                    "tags": tags_val or [],
+                })
+
+    return bucket_contents
 
 
 # --------- 4) Reward meta (RewardID -> metadata used by the UI)
 
-PVP_REWARD_META = {}
-
-for r in reward_rows:
-    rid = (r.get("RewardID") or r.get("RewardId") or "").strip()
-    if not rid:
-        continue
-
-    raw_item_field = (r.get("Item") or "").strip()  # ex: "[LBID]PvP_FactionDye" ou "[LTID]PvP_BasicArmor..."
-    def strip_prefix(x: str) -> str:
-        if x.startswith("[LBID]"):
-            return x[len("[LBID]"):]
-        if x.startswith("[LTID]"):
-            return x[len("[LTID]"):]
-        return x
-    item_clean = strip_prefix(raw_item_field)
-
-    # --- classify
-    is_lb = raw_item_field.startswith("[LBID]")
-    is_lt = raw_item_field.startswith("[LTID]")
-
-    meta = {
-        "name": (r.get("Name") or "").strip(),
-        "description": r.get("Description") or "",
-        "icon": full_icon(r.get("IconPath") or ""),
-        "rarity": "",
-        "rollOnPresent": bool(r.get("RollOnPresent", False)),
-        "quantity": r.get("Quantity"),
-        "buyCost": r.get("BuyCategoricalProgressionCost"),
-        "buyCurrency": r.get("BuyCategoricalProgressionCurrencyId") or r.get("CategoricalProgressionId") or "",
-        "rawItemField": raw_item_field,
-        "gameEvent": r.get("GameEvent") or "",
-
-        # IMPORTANT:
-        "lootTableId": None,
-        "directBucketId": None,
-    }
+def build_reward_meta(reward_rows):
+    PVP_REWARD_META = {}
+
+    for r in reward_rows:
+        rid = (r.get("RewardID") or r.get("RewardId") or "").strip()
+        if not rid:
+            continue
+
+        raw_item_field = (r.get("Item") or "").strip()  # ex: "[LBID]PvP_FactionDye" ou "[LTID]PvP_BasicArmor..."
+        def strip_prefix(x: str) -> str:
+            if x.startswith("[LBID]"):
+                return x[len("[LBID]"):]
+            if x.startswith("[LTID]"):
+                return x[len("[LTID]"):]
+            return x
+        item_clean = strip_prefix(raw_item_field)
+
+        # --- classify
+        is_lb = raw_item_field.startswith("[LBID]")
+        is_lt = raw_item_field.startswith("[LTID]")
+
+        meta = {
+            "name": (r.get("Name") or "").strip(),
+            "description": r.get("Description") or "",
+            "icon": full_icon(r.get("IconPath") or ""),
+            "rarity": "",
+            "rollOnPresent": bool(r.get("RollOnPresent", False)),
+            "quantity": r.get("Quantity"),
+            "buyCost": r.get("BuyCategoricalProgressionCost"),
+            "buyCurrency": r.get("BuyCategoricalProgressionCurrencyId") or r.get("CategoricalProgressionId") or "",
+            "rawItemField": raw_item_field,
+            "gameEvent": r.get("GameEvent") or "",
+
+            # IMPORTANT:
+            "lootTableId": None,
+            "directBucketId": None,
+        }
 
-    # Si c’est un LBID -> on renseigne directBucketId et on NE RENSEIGNE PAS lootTableId
-    if item_clean:
-        if is_lt:
-            # IMPORTANT :
-            # Toujours garder la LootTable d'origine,
-            # même si rollOnPresent est False,
-            # sinon on ne peut plus calculer les GS ranges.
-            meta["lootTableId"] = item_clean.replace("[LTID]", "")
+        # Si c’est un LBID -> on renseigne directBucketId et on NE RENSEIGNE PAS lootTableId
+        if item_clean:
+            if is_lt:
+                # IMPORTANT :
+                # Toujours garder la LootTable d'origine,
+                # même si rollOnPresent est False,
+                # sinon on ne peut plus calculer les GS ranges.
+                meta["lootTableId"] = item_clean.replace("[LTID]", "")
 
-        if is_lb and meta["rollOnPresent"]:
-            # directBucketId ne doit exister que si on donne DIRECTEMENT ce bucket,
-            # pas juste un sous-bucket d'une LT plus profonde.
-            meta["directBucketId"] = item_clean.replace("[LBID]", "")
+            if is_lb and meta["rollOnPresent"]:
+                # directBucketId ne doit exister que si on donne DIRECTEMENT ce bucket,
+                # pas juste un sous-bucket d'une LT plus profonde.
+                meta["directBucketId"] = item_clean.replace("[LBID]", "")
 
-    # marqueurs entitlement / skins / artefacts
-    is_ent = rid.startswith("ENT_")          # tous les ENT_ (skins, emotes, titres, etc.)
-    is_skin = rid.startswith("ENT_Skin")     # uniquement les skins
-    is_art = rid.startswith("ITM_Artifacts") or ("artifact" in (r.get("ExcludeTypeStage") or "").lower())
+        # marqueurs entitlement / skins / artefacts
+        is_ent = rid.startswith("ENT_")          # tous les ENT_ (skins, emotes, titres, etc.)
+        is_skin = rid.startswith("ENT_Skin")     # uniquement les skins
+        is_art = rid.startswith("ITM_Artifacts") or ("artifact" in (r.get("ExcludeTypeStage") or "").lower())
 
-    # info annexe pour debug/affichage
-    meta["isSkin"] = bool(is_skin)
+        # info annexe pour debug/affichage
+        meta["isSkin"] = bool(is_skin)
 
-    # uniqueEligible = peut être coché comme "Owned?"
-    # - Artifacts => oui
-    # - ENT_* sauf ENT_Skin* => oui (ex: emotes, titres, etc.)
-    # - ENT_Skin* => non (les skins restent dans le pool même si tu les as)
-    meta["uniqueEligible"] = bool(is_art or (is_ent and not is_skin))
+        # uniqueEligible = peut être coché comme "Owned?"
+        # - Artifacts => oui
+        # - ENT_* sauf ENT_Skin* => oui (ex: emotes, titres, etc.)
+        # - ENT_Skin* => non (les skins restent dans le pool même si tu les as)
+        meta["uniqueEligible"] = bool(is_art or (is_ent and not is_skin))
 
-    PVP_REWARD_META[rid] = meta
+        PVP_REWARD_META[rid] = meta
 
+    return PVP_REWARD_META
 
 
 
@@ -736,17 +863,233 @@ def enrich_bucket_items(bucket_contents_dict):
             it["rarity"] = rarity_val or ""
 
 
-# apply enrichment
-enrich_reward_meta(PVP_REWARD_META)
-enrich_bucket_items(bucket_contents)
+# --------- SEASON BUILD
+
+def season_inputs(season_dir: str):
+    """
+    Input paths for one season directory ("." = the legacy single-season layout).
+    The item CSV is season-named, so fall back to the exportItemsNames*.csv
+    in the directory; several candidates is an error (no guessing the season).
+    """
+    def p(name):
+        return os.path.join(season_dir, name)
+
+    itemcsv = p(INPUT_ITEMCSV)
+    if not os.path.exists(itemcsv):
+        found = sorted(glob.glob(p(ITEMCSV_GLOB)))
+        if len(found) > 1:
+            names = [os.path.basename(f) for f in found]
+            raise ValueError(f"{season_dir}: several item CSVs {names}, keep only one "
+                             f"or name it {INPUT_ITEMCSV}")
+        if found:
+            itemcsv = found[0]
+
+    return {
+        "store": p(INPUT_STORE),
+        "rewards": p(INPUT_REWARDS),
+        "loottables": p(INPUT_LOOTTABLES),
+        "lootbuckets": p(INPUT_LOOTBUCKETS),
+        "housing": p(INPUT_HOUSING),
+        "gameevents": p(INPUT_GAMEEVENTS),
+        "itemcsv": itemcsv,
+        "enus": p(INPUT_ENUS),
+        "emotes": p(INPUT_EMOTES),
+    }
+
+
+def catalog_keys(inputs):
+    """
+    Cache key of each parsed catalog piece. The CSV / housing names are
+    resolved through en-us, so their keys include the en-us digest too:
+    seasons share a piece whenever those files are byte-identical.
+    """
+    enus = file_digest(inputs["enus"])
+    return {
+        "enus": f"enus-{enus}",
+        "itemcsv": f"itemcsv-{enus}-{file_digest(inputs['itemcsv'])}",
+        "housing": f"housing-{enus}-{file_digest(inputs['housing'])}",
+    }
+
+
+def build_season(season_dir: str, output_js: str, catalog_keys=None, catalog_cache=None):
+    """
+    Full pipeline for one season directory -> data.js (+ data.idx next to it,
+    and an empty plan.js if there is none yet).
+    Catalog pieces found in `catalog_cache` under `catalog_keys` are reused,
+    the others are parsed here.
+    """
+    global emote_icon_by_key, emote_prettyname_by_key, gameevent_by_id, rows_by_loot_id
+
+    inputs = season_inputs(season_dir)
+
+    load_catalogs(inputs["enus"], inputs["itemcsv"], inputs["housing"],
+                  keys=catalog_keys, cache=catalog_cache)
+
+    store_rows = load_json(inputs["store"])
+    reward_rows = load_json(inputs["rewards"])
+    loot_rows = load_json(inputs["loottables"])
+    lootbuckets_rows = load_json(inputs["lootbuckets"])
+
+    emote_icon_by_key, emote_prettyname_by_key = build_emote_maps(load_json(inputs["emotes"]))
+    gameevent_by_id = build_gameevent_index(load_json(inputs["gameevents"]))
+    rows_by_loot_id = {row["LootTableID"]: row for row in loot_rows}
+
+    PVP_DATA = build_pvp_data(build_long_rows(store_rows))
+    PVP_LOOT_TABLES, PVP_LOOT_CONTENTS = build_loot_tables()
+    bucket_contents = build_bucket_contents(lootbuckets_rows)
+    PVP_REWARD_META = build_reward_meta(reward_rows)
+
+    # apply enrichment
+    enrich_reward_meta(PVP_REWARD_META)
+    enrich_bucket_items(bucket_contents)
+
+    write_data_js(output_js, PVP_DATA, PVP_REWARD_META, PVP_LOOT_TABLES,
+                  PVP_LOOT_CONTENTS, bucket_contents)
+    write_binary_index(os.path.join(os.path.dirname(output_js), OUTPUT_INDEX),
+                       PVP_DATA, PVP_REWARD_META, PVP_LOOT_TABLES, bucket_contents)
+    write_empty_plan_js(os.path.join(os.path.dirname(output_js), OUTPUT_PLAN_JS))
+    return output_js
+
 
 # --------- OUTPUT (data.js)
 
-with open(OUTPUT_JS, "w", encoding="utf-8") as f:
-    f.write("window.PVP_DATA=" + json.dumps(PVP_DATA, separators=(",", ":")) + ";\n")
-    f.write("window.PVP_REWARD_META=" + json.dumps(PVP_REWARD_META, separators=(",", ":")) + ";\n")
-    f.write("window.PVP_LOOT_TABLES=" + json.dumps(PVP_LOOT_TABLES, separators=(",", ":")) + ";\n")
-    f.write("window.PVP_LOOT_CONTENTS=" + json.dumps(PVP_LOOT_CONTENTS, separators=(",", ":")) + ";\n")
-    f.write("window.PVP_BUCKET_CONTENTS=" + json.dumps(bucket_contents, separators=(",", ":")) + ";\n")
+def write_data_js(path, PVP_DATA, PVP_REWARD_META, PVP_LOOT_TABLES,
+                  PVP_LOOT_CONTENTS, bucket_contents):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("window.PVP_DATA=" + json.dumps(PVP_DATA, separators=(",", ":")) + ";\n")
+        f.write("window.PVP_REWARD_META=" + json.dumps(PVP_REWARD_META, separators=(",", ":")) + ";\n")
+        f.write("window.PVP_LOOT_TABLES=" + json.dumps(PVP_LOOT_TABLES, separators=(",", ":")) + ";\n")
+        f.write("window.PVP_LOOT_CONTENTS=" + json.dumps(PVP_LOOT_CONTENTS, separators=(",", ":")) + ";\n")
+        f.write("window.PVP_BUCKET_CONTENTS=" + json.dumps(bucket_contents, separators=(",", ":")) + ";\n")
+        f.write("window.PVP_OWNED_INDEX=" + json.dumps(build_owned_index(PVP_DATA, PVP_REWARD_META),
+                                                      separators=(",", ":")) + ";\n")
+
+
+def write_empty_plan_js(path):
+    """index.html always loads plan.js; keep an existing plan, else write a null one."""
+    if os.path.exists(path):
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("window.PVP_PLAN=null;\n")
+
+
+# --------- MULTI-SEASON
+
+# catalog piece key (catalog_keys) -> parsed piece.
+# Filled in the parent before the pool forks, so workers inherit it for free.
+_CATALOG_CACHE = {}
+
+def _build_season_job(season_dir, output_js, keys):
+    return build_season(season_dir, output_js, keys, _CATALOG_CACHE)
+
+
+def _cache_catalog_pieces(inputs, keys, names):
+    """
+    Parse the catalog pieces in `names` into _CATALOG_CACHE. A shared CSV /
+    housing key implies a shared en-us, so en-us is parsed (and installed) first.
+    """
+    global en_us_lower
+    parsers = {"enus": parse_en_us, "itemcsv": parse_item_csv, "housing": parse_housing}
+    for name in ("enus", "itemcsv", "housing"):
+        key = keys[name]
+        if name in names and key not in _CATALOG_CACHE:
+            _CATALOG_CACHE[key] = parsers[name](inputs[name])
+        if name == "enus" and key in _CATALOG_CACHE:
+            en_us_lower = _CATALOG_CACHE[key]
+
+
+def build_seasons(season_dirs, out_dir, jobs=None):
+    """
+    Build several season directories in a process pool.
+    Writes <out_dir>/<season>/data.js + data.idx for each one plus <out_dir>/seasons.json.
+    Catalog pieces (en-us, item CSV, housing) shared by several seasons are
+    parsed once, in the parent.
+    """
+    seasons = []
+    for d in season_dirs:
+        name = os.path.basename(os.path.normpath(d))
+        inputs = season_inputs(d)
+        seasons.append({
+            "name": name,
+            "source": d,
+            "dataJs": os.path.join(out_dir, name, OUTPUT_JS),
+            "index": os.path.join(out_dir, name, OUTPUT_INDEX),
+            "catalogKeys": catalog_keys(inputs),
+            "inputs": inputs,
+        })
+
+    names = [s["name"] for s in seasons]
+    if len(set(names)) != len(names):
+        raise ValueError(f"duplicate season directory names: {names}")
+
+    # Only a forked worker sees the parent's cache; elsewhere each worker
+    # parses its own catalogs (still correct, just not shared).
+    can_fork = "fork" in multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("fork" if can_fork else None)
+
+    if can_fork:
+        # parse in the parent every piece that more than one season uses;
+        # pieces unique to a season are left to its worker
+        users = {}
+        for s in seasons:
+            for key in s["catalogKeys"].values():
+                users[key] = users.get(key, 0) + 1
+        for s in seasons:
+            keys = s["catalogKeys"]
+            shared = [name for name, k in keys.items() if users[k] > 1]
+            if shared:
+                _cache_catalog_pieces(s["inputs"], keys, shared)
+
+    for s in seasons:
+        os.makedirs(os.path.dirname(s["dataJs"]), exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as pool:
+        futures = [
+            pool.submit(_build_season_job, s["source"], s["dataJs"], s["catalogKeys"])
+            for s in seasons
+        ]
+        for s, fut in zip(seasons, futures):
+            fut.result()
+            print("OK ->", s["dataJs"])
+
+    manifest = {
+        "seasons": [
+            {
+                "name": s["name"],
+                "source": s["source"],
+                "dataJs": os.path.relpath(s["dataJs"], out_dir),
+                "index": os.path.relpath(s["index"], out_dir),
+                "catalogKeys": s["catalogKeys"],
+            }
+            for s in seasons
+        ],
+    }
+    manifest_path = os.path.join(out_dir, SEASON_MANIFEST)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    print("OK ->", manifest_path)
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build data.js from javelindata dumps.")
+    parser.add_argument("--seasons", nargs="+", metavar="DIR",
+                        help="season directories to build in parallel (default: current directory only)")
+    parser.add_argument("--out-dir", default="seasons",
+                        help="output root for --seasons (default: seasons)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes for --seasons (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    if args.seasons:
+        build_seasons(args.seasons, args.out_dir, args.jobs)
+        return
+
+    build_season(".", OUTPUT_JS)
+    print("OK ->", OUTPUT_JS)
+    print("OK ->", OUTPUT_INDEX)
+
 
-print("OK ->", OUTPUT_JS)
+if __name__ == "__main__":
+    main()
@@ -42,7 +42,9 @@
       const bv = getSortVal(b, SORT_KEY);
       if (av < bv) return -1 * mul;
       if (av > bv) return  1 * mul;
-      return 0;
+      // ex aequo : ordre fixe, pour qu'un rendu incrémental (toggle owned)
+      // donne le même ordre qu'un recalcul complet
+      return a.rewardId < b.rewardId ? -1 : (a.rewardId > b.rewardId ? 1 : 0);
     });
   }
  
@@ -217,9 +219,18 @@ function makeInnerTableSortable(tableEl) {
 }
 
 
+  const OWNED_STORAGE_KEY = "pvpOwnedRewards";
+
+  // Le set "owned" vit en mémoire : localStorage n'est lu qu'une fois
+  // et n'est réécrit que de façon différée (flushOwned).
+  let OWNED = null;
+  let OWNED_SAVE_TIMER = null;
+  // toggles pas encore écrits : rewardId -> owned?
+  const OWNED_PENDING = new Map();
+
   function loadOwned() {
     try {
-      const raw = localStorage.getItem("pvpOwnedRewards");
+      const raw = localStorage.getItem(OWNED_STORAGE_KEY);
       if (!raw) return [];
       const arr = JSON.parse(raw);
       return Array.isArray(arr) ? arr : [];
@@ -229,21 +240,67 @@ function makeInnerTableSortable(tableEl) {
   }
 
   function saveOwned(list) {
-    localStorage.setItem("pvpOwnedRewards", JSON.stringify(list));
+    try {
+      localStorage.setItem(OWNED_STORAGE_KEY, JSON.stringify(list));
+    } catch {
+      // quota / mode privé : on garde juste l'état en mémoire
+    }
   }
 
-  function isOwned(list, id) {
-    return list.includes(id);
+  function getOwnedSet() {
+    if (!OWNED) OWNED = new Set(loadOwned());
+    return OWNED;
   }
 
-  function toggleOwned(id) {
-    const list = loadOwned();
-    const i = list.indexOf(id);
-    if (i === -1) list.push(id);
-    else list.splice(i, 1);
-    saveOwned(list);
+  function flushOwned() {
+    if (OWNED_SAVE_TIMER !== null) {
+      clearTimeout(OWNED_SAVE_TIMER);
+      OWNED_SAVE_TIMER = null;
+    }
+    OWNED_PENDING.clear();
+    if (OWNED) saveOwned(Array.from(OWNED));
+  }
+
+  function scheduleOwnedSave() {
+    if (OWNED_SAVE_TIMER !== null) return;
+    OWNED_SAVE_TIMER = setTimeout(flushOwned, 500);
   }
 
+  function toggleOwned(id) {
+    const owned = getOwnedSet();
+    const nowOwned = !owned.has(id);
+    if (nowOwned) owned.add(id);
+    else owned.delete(id);
+    applyOwnedDelta(id, nowOwned);
+    OWNED_PENDING.set(id, nowOwned);
+    scheduleOwnedSave();
+  }
+
+  // ne pas perdre le dernier toggle si l'onglet se ferme avant le timer
+  window.addEventListener("pagehide", flushOwned);
+  document.addEventListener("visibilitychange", () => {
+    if (document.visibilityState === "hidden") flushOwned();
+  });
+
+  // modifié depuis un autre onglet : on repart du storage, en y rejouant
+  // nos toggles pas encore écrits (sinon ils seraient perdus)
+  window.addEventListener("storage", (e) => {
+    if (e.key !== OWNED_STORAGE_KEY) return;
+    const owned = new Set(loadOwned());
+    for (const [id, nowOwned] of OWNED_PENDING) {
+      if (nowOwned) owned.add(id);
+      else owned.delete(id);
+    }
+    OWNED = owned;
+    if (OWNED_PENDING.size > 0) flushOwned();   // écrit la fusion, arrête le timer
+    else if (OWNED_SAVE_TIMER !== null) {
+      clearTimeout(OWNED_SAVE_TIMER);
+      OWNED_SAVE_TIMER = null;
+    }
+    NOTCH_DIST_CACHE.clear();
+    onCalc();
+  });
+
   // Uniquement ce que data.js marque comme uniqueEligible (Artifacts)
   function isUniqueEligible(rewardId) {
     const meta = window.PVP_REWARD_META?.[rewardId];
@@ -314,6 +371,32 @@ function makeInnerTableSortable(tableEl) {
     return meta.buyCost;
   }
 
+  // window.PVP_PLAN (optionnel, pvp_planner.py --out plan.js)
+  let PLAN_BY_ID = null;
+
+  function getPlanTarget(rewardId) {
+    const plan = window.PVP_PLAN;
+    if (!plan?.targets) return null;
+    if (!PLAN_BY_ID) PLAN_BY_ID = new Map(plan.targets.map(t => [t.rewardId, t]));
+    return PLAN_BY_ID.get(rewardId) || null;
+  }
+
+  // Note sous le coût : "buy now" (seulement au niveau pour lequel le plan
+  // a été calculé) et le niveau à partir duquel l'acheter s'il reste seul.
+  function planNoteHTML(rewardId, trackLevel, owned) {
+    const t = getPlanTarget(rewardId);
+    if (!t || owned) return "";
+    const notes = [];
+    if (window.PVP_PLAN.trackLevel === trackLevel && window.PVP_PLAN.buyNow?.includes(rewardId)) {
+      notes.push(`<span class="text-emerald-400 font-medium">buy now</span>`);
+    }
+    if (t.buyIfLastAt != null) {
+      notes.push(`<span class="text-slate-400">if last: buy from lvl ${t.buyIfLastAt}</span>`);
+    }
+    if (!notes.length) return "";
+    return `<div class="text-[10px] leading-tight mt-1">${notes.join("<br>")}</div>`;
+  }
+
   // ----------------- Gearscore estimation -----------------
 
   function pickTierForValue(def, value) {
@@ -401,6 +484,123 @@ function recomputeDistributionAfterFilter(levelData, ownedListOrSet) {
 }
 
 
+// ----------------- Incremental owned reweighting -----------------
+//
+// window.PVP_OWNED_INDEX (build_data.py) :
+//   levelClass[lvl]  -> classe de niveau (mêmes pools de notch)
+//   totals[cls]      -> [totalWeight N1, N2, N3] sans filtre
+//   unique[rid]      -> [[cls, notch, weight], ...] pour les uniqueEligible
+//
+// On garde une distribution par (classe, notch). Un toggle "owned" ne touche
+// que les notch qui contiennent la récompense : total -= / += weight,
+// retrait / réinsertion de la ligne, puis rescale des % de cette notch.
+
+const NOTCH_DIST_CACHE = new Map(); // "cls:notch" -> { cls, notch, base, pos, rank, ownedW, dist }
+let CLASS_FIRST_LEVEL = null;       // cls -> premier niveau de cette classe
+
+function levelClassOf(trackLvl) {
+  const cls = window.PVP_OWNED_INDEX?.levelClass?.[trackLvl];
+  return cls === undefined ? null : cls;
+}
+
+function firstLevelOfClass(cls) {
+  if (!CLASS_FIRST_LEVEL) {
+    CLASS_FIRST_LEVEL = [];
+    const lc = window.PVP_OWNED_INDEX?.levelClass || [];
+    lc.forEach((c, lvl) => {
+      if (CLASS_FIRST_LEVEL[c] === undefined) CLASS_FIRST_LEVEL[c] = lvl;
+    });
+  }
+  return CLASS_FIRST_LEVEL[cls];
+}
+
+function rescaleNotchDist(c) {
+  const totalW = window.PVP_OWNED_INDEX.totals[c.cls][c.notch - 1] - c.ownedW;
+  c.dist.totalWeight = totalW;
+  for (const k of c.dist.rewards) {
+    if (totalW > 0) {
+      const p = k.weight / totalW;
+      k.percentSingle = p * 100;
+      k.percentAtLeastOneOfThree = (1 - Math.pow(1 - p, 3)) * 100;
+    } else {
+      k.percentSingle = 0;
+      k.percentAtLeastOneOfThree = 0;
+    }
+  }
+}
+
+function getNotchDistCached(cls, notch) {
+  const key = `${cls}:${notch}`;
+  let c = NOTCH_DIST_CACHE.get(key);
+  if (c) return c.dist;
+
+  // PVP_DATA est déjà trié par poids décroissant : même ordre que le tri
+  // par percentAtLeastOneOfThree de recomputeDistributionAfterFilter
+  const levelData = getNotchData(firstLevelOfClass(cls), notch);
+  const owned = getOwnedSet();
+  const base = [];
+  const pos = new Map();   // rid -> indices dans base (une récompense peut apparaître plusieurs fois)
+  const rank = new Map();  // ligne -> indice dans base
+  const kept = [];
+  let ownedW = 0;
+
+  for (const row of levelData?.rewards || []) {
+    const rid = row.rewardId;
+    if (!rid) continue;
+    const k = {
+      rewardId: rid,
+      weight: row.weight,
+      selectOnceOnly: !!row.selectOnceOnly,
+      percentSingle: 0,
+      percentAtLeastOneOfThree: 0,
+    };
+    if (!pos.has(rid)) pos.set(rid, []);
+    pos.get(rid).push(base.length);
+    rank.set(k, base.length);
+    base.push(k);
+    if (isUniqueEligible(rid) && owned.has(rid)) ownedW += row.weight;
+    else kept.push(k);
+  }
+
+  c = { cls, notch, base, pos, rank, ownedW, dist: { totalWeight: 0, rewards: kept } };
+  rescaleNotchDist(c);
+  NOTCH_DIST_CACHE.set(key, c);
+  return c.dist;
+}
+
+function applyOwnedDelta(rewardId, nowOwned) {
+  const hits = window.PVP_OWNED_INDEX?.unique?.[rewardId];
+  if (!hits) return;
+
+  for (const [cls, notch, weight] of hits) {
+    const c = NOTCH_DIST_CACHE.get(`${cls}:${notch}`);
+    if (!c) continue; // sera construit à jour au prochain accès
+
+    const rows = c.dist.rewards;
+    const ats = c.pos.get(rewardId);
+    if (!ats) continue;
+    // weight = somme des lignes de cette récompense dans la notch
+    if (rows.includes(c.base[ats[0]]) !== nowOwned) continue;
+
+    if (nowOwned) {
+      for (let i = rows.length - 1; i >= 0; i--) {
+        if (rows[i].rewardId === rewardId) rows.splice(i, 1);
+      }
+      c.ownedW += weight;
+    } else {
+      // réinsertion à leur place dans l'ordre de base
+      for (const at of ats) {
+        let i = 0;
+        while (i < rows.length && c.rank.get(rows[i]) < at) i++;
+        rows.splice(i, 0, c.base[at]);
+      }
+      c.ownedW -= weight;
+    }
+    rescaleNotchDist(c);
+  }
+}
+
+
 // pcts = [ pNotch1, pNotch2, pNotch3 ] en %
 function trackAnyFromArray(pcts, onceOnly) {
   const p1 = (pcts[0] || 0) / 100;
@@ -1133,6 +1333,10 @@ function attachBucketRowToggles(root) {
             summaryObj
           );
 
+          container
+            .querySelectorAll(".bucket-final-table")
+            .forEach(tbl => makeInnerTableSortable(tbl));
+
           container.dataset.filled = "1";
         }
       }
@@ -1147,7 +1351,17 @@ function attachBucketRowToggles(root) {
   // ----------------- Building the table rows -----------------
 
   function buildAllNotchDists(trackLevel, playerLevel) {
-    const owned = loadOwned();
+    const cls = levelClassOf(trackLevel);
+    if (cls !== null) {
+      return {
+        d1: getNotchDistCached(cls, 1),
+        d2: getNotchDistCached(cls, 2),
+        d3: getNotchDistCached(cls, 3),
+      };
+    }
+
+    // data.js sans PVP_OWNED_INDEX : filtrage complet à chaque calcul
+    const owned = getOwnedSet();
     return {
       d1: recomputeDistributionAfterFilter(getNotchData(trackLevel, 1), owned),
       d2: recomputeDistributionAfterFilter(getNotchData(trackLevel, 2), owned),
@@ -1172,6 +1386,29 @@ function parseGsRangeToMinMax(gsStr) {
 }
 
 
+// Copies pratiques pour le tri / affichage de colonnes, à partir de row.perNotch
+// (aussi rappelé après un toggle "owned" qui ne change que les % d'une notch)
+function setRowOdds(row) {
+  for (const n of [1, 2, 3]) {
+    const d = row.perNotch[n];
+    row[`n${n}Weight`] = d?.weight || 0;
+    row[`n${n}PctSingle`] = d?.percentSingle || 0;
+    row[`n${n}PctAny`] = d?.percentAtLeastOneOfThree || 0;
+  }
+  // Probabilité d'obtenir AU MOINS UNE copie sur la track complète
+  row.trackPct = trackAnyFromArray([row.n1PctAny, row.n2PctAny, row.n3PctAny], row.selectOnceOnly);
+  return row;
+}
+
+function notchStats(entry) {
+  return {
+    weight: entry.weight || 0,
+    percentSingle: entry.percentSingle || 0,
+    percentAtLeastOneOfThree: entry.percentAtLeastOneOfThree || 0,
+    selectOnceOnly: !!entry.selectOnceOnly,
+  };
+}
+
 function buildMergedRows(playerLevel, trackLevel, d1, d2, d3) {
   // On fusionne les récompenses des 3 encoches (Notch 1/2/3)
   // pour produire UNE ligne par rewardId, avec les stats par encoche.
@@ -1192,12 +1429,7 @@ function buildMergedRows(playerLevel, trackLevel, d1, d2, d3) {
       }
 
       // Sauvegarde les stats pour CETTE encoche
-      merged[rid].perNotch[notchNum] = {
-        weight: entry.weight || 0,
-        percentSingle: entry.percentSingle || 0,
-        percentAtLeastOneOfThree: entry.percentAtLeastOneOfThree || 0,
-        selectOnceOnly: !!entry.selectOnceOnly,
-      };
+      merged[rid].perNotch[notchNum] = notchStats(entry);
 
       // Si c'est "SelectOnceOnly" quelque part, on le marque sur la ligne globale
       if (entry.selectOnceOnly) {
@@ -1213,65 +1445,50 @@ function buildMergedRows(playerLevel, trackLevel, d1, d2, d3) {
   const rows = [];
   for (const rid in merged) {
     const m = merged[rid];
+    rows.push(buildRowFor(rid, m.perNotch, m.selectOnceOnly, playerLevel, trackLevel));
+  }
 
-    // Probabilité d'obtenir AU MOINS UNE copie sur la track complète
-    const p1 = m.perNotch[1]?.percentAtLeastOneOfThree || 0;
-    const p2 = m.perNotch[2]?.percentAtLeastOneOfThree || 0;
-    const p3 = m.perNotch[3]?.percentAtLeastOneOfThree || 0;
-    const trackPct = trackAnyFromArray([p1, p2, p3], m.selectOnceOnly);
-
-    // GS range affichée + min/max numériques pour le tri
-    const gsStr = getGsRangeForReward(rid, playerLevel, trackLevel); // "590-600" ou "—"
-    let gsMin = 0, gsMax = 0;
-    if (gsStr && /\d/.test(gsStr)) {
-      const m2 = gsStr.match(/(\d+)\s*-\s*(\d+)/);
-      if (m2) {
-        gsMin = +m2[1];
-        gsMax = +m2[2];
-      } else {
-        const n = parseInt(gsStr, 10);
-        if (!isNaN(n)) {
-          gsMin = n;
-          gsMax = n;
-        }
+  // Tri par défaut = plus grosse chance Track1/9 en haut
+  rows.sort((a, b) => b.trackPct - a.trackPct);
+  return rows;
+}
+
+// Une ligne du tableau principal pour une récompense (stats par encoche déjà fusionnées)
+function buildRowFor(rid, perNotch, selectOnceOnly, playerLevel, trackLevel) {
+  // GS range affichée + min/max numériques pour le tri
+  const gsStr = getGsRangeForReward(rid, playerLevel, trackLevel); // "590-600" ou "—"
+  let gsMin = 0, gsMax = 0;
+  if (gsStr && /\d/.test(gsStr)) {
+    const m2 = gsStr.match(/(\d+)\s*-\s*(\d+)/);
+    if (m2) {
+      gsMin = +m2[1];
+      gsMax = +m2[2];
+    } else {
+      const n = parseInt(gsStr, 10);
+      if (!isNaN(n)) {
+        gsMin = n;
+        gsMax = n;
       }
     }
+  }
 
-    const meta = getMeta(rid);
+  const meta = getMeta(rid);
 
-    rows.push({
-      rewardId: rid,
-      displayName: getDisplayName(rid),
-      gs: gsStr,
-      gsMin, gsMax,
-      cost: getAzothCost(rid),
-      icon: getIconForReward(rid),
-      rarity: getRarityForReward(rid),
-      uniqueEligible: !!meta?.uniqueEligible,
-      rollOnPresent: !!meta?.rollOnPresent,
-      lootTableId: meta?.lootTableId || null,
-
-      perNotch: m.perNotch,
-      selectOnceOnly: m.selectOnceOnly,
-
-      // Copies pratiques pour le tri / affichage de colonnes
-      n1Weight: m.perNotch[1]?.weight || 0,
-      n1PctSingle: m.perNotch[1]?.percentSingle || 0,
-      n1PctAny: m.perNotch[1]?.percentAtLeastOneOfThree || 0,
-      n2Weight: m.perNotch[2]?.weight || 0,
-      n2PctSingle: m.perNotch[2]?.percentSingle || 0,
-      n2PctAny: m.perNotch[2]?.percentAtLeastOneOfThree || 0,
-      n3Weight: m.perNotch[3]?.weight || 0,
-      n3PctSingle: m.perNotch[3]?.percentSingle || 0,
-      n3PctAny: m.perNotch[3]?.percentAtLeastOneOfThree || 0,
+  return setRowOdds({
+    rewardId: rid,
+    displayName: getDisplayName(rid),
+    gs: gsStr,
+    gsMin, gsMax,
+    cost: getAzothCost(rid),
+    icon: getIconForReward(rid),
+    rarity: getRarityForReward(rid),
+    uniqueEligible: !!meta?.uniqueEligible,
+    rollOnPresent: !!meta?.rollOnPresent,
+    lootTableId: meta?.lootTableId || null,
 
-      trackPct,
-    });
-  }
-
-  // Tri par défaut = plus grosse chance Track1/9 en haut
-  rows.sort((a, b) => b.trackPct - a.trackPct);
-  return rows;
+    perNotch,
+    selectOnceOnly,
+  });
 }
 
 
@@ -1284,7 +1501,7 @@ function buildMergedRows(playerLevel, trackLevel, d1, d2, d3) {
     const count = document.getElementById("ownedCount");
     if (!wrap || !body || !count) return;
 
-    const raw = loadOwned().filter((id) => isUniqueEligible(id));
+    const raw = Array.from(getOwnedSet()).filter((id) => isUniqueEligible(id));
     if (!raw.length) {
       wrap.classList.add("hidden");
       body.innerHTML = "";
@@ -1338,7 +1555,7 @@ function buildMergedRows(playerLevel, trackLevel, d1, d2, d3) {
       btn.textContent = "✕";
       btn.addEventListener("click", () => {
         toggleOwned(rid);
-        onCalc();
+        onOwnedToggled(rid);
       });
       tdAct.appendChild(btn);
 
@@ -1353,248 +1570,454 @@ function buildMergedRows(playerLevel, trackLevel, d1, d2, d3) {
 
   // ----------------- Main table render -----------------
 
-  function renderMergedRows(playerLevel, trackLevel, rows) {
-    const tbody = document.getElementById("resultsBodyAll");
-    if (!tbody) return;
-    tbody.innerHTML = "";
+  // Rendu "keyé" du tableau principal :
+  // une entrée par rewardId, réutilisée d'un onCalc() à l'autre.
+  // On ne recrée jamais les <tr> / checkbox / listeners, on patche juste
+  // les cellules dont le contenu a changé et on réordonne les nœuds existants.
+  const MAIN_ROW_CACHE = new Map(); // rewardId -> entry
+
+  const DRILL_CLASSES = [
+    "cursor-pointer",
+    "text-indigo-300",
+    "underline",
+    "decoration-dotted",
+    "hover:text-indigo-200",
+  ];
+
+  // n'écrit dans le DOM que si le contenu a réellement changé
+  function patchCellHTML(entry, key, td, html) {
+    if (entry.rendered[key] === html) return;
+    entry.rendered[key] = html;
+    td.innerHTML = html;
+  }
+
+  function patchCellText(entry, key, td, text) {
+    const s = String(text);
+    if (entry.rendered[key] === s) return;
+    entry.rendered[key] = s;
+    td.textContent = s;
+  }
+
+  // Tout ce dont dépend le bloc de détails (LT/LB) d'une ligne.
+  // Si la clé ne change pas, le contenu déjà construit reste valide.
+  function detailsKeyFor(playerLevel, trackLevel, row) {
+    return [
+      playerLevel,
+      trackLevel,
+      row.selectOnceOnly ? 1 : 0,
+      row.n1PctSingle, row.n1PctAny,
+      row.n2PctSingle, row.n2PctAny,
+      row.n3PctSingle, row.n3PctAny,
+    ].join("|");
+  }
+
+  function buildLootTableDetailsForRow(row, playerLevel, trackLevel) {
+    // Build per-notch parent chances (for that reward only)
+    const perNotchParent = {};
+    for (const n of [1, 2, 3]) {
+      if (row.perNotch && row.perNotch[n]) {
+        perNotchParent[n] = {
+          percentSingle: row.perNotch[n].percentSingle,
+          percentAtLeastOneOfThree: row.perNotch[n].percentAtLeastOneOfThree,
+          selectOnceOnly: row.perNotch[n].selectOnceOnly === true,
+        };
+      }
+    }
 
-    const owned = loadOwned();
+    return buildLootDetailsHTMLMulti(
+      row.lootTableId,
+      playerLevel,
+      trackLevel,
+      perNotchParent
+    );
+  }
 
-    for (const row of rows) {
-      const tr = document.createElement("tr");
-      tr.className = "odd:bg-slate-800/40 even:bg-slate-800/20 align-top";
-      tr.id = `reward-${row.rewardId}`;
-      tr.setAttribute("data-reward-id", row.rewardId);
-
-      // Owned? column (checkbox for cosmetics / artifacts)
-      const tdOwned = document.createElement("td");
-      tdOwned.className = "px-2 py-2 text-center align-top w-[2rem]";
-      if (row.uniqueEligible) {
-        const cb = document.createElement("input");
-        cb.type = "checkbox";
-        cb.className = "chk";
-        cb.checked = isOwned(owned, row.rewardId);
-        cb.setAttribute("aria-label", "Already owned?");
-        cb.addEventListener("click", (e) => {
-          e.stopPropagation();
-          toggleOwned(row.rewardId);
-          onCalc();
-        });
-        tdOwned.appendChild(cb);
-      } else {
-        tdOwned.innerHTML = `<span class="text-slate-500 text-[11px]">—</span>`;
+  function buildDirectBucketDetailsForRow(row, bucketId, playerLevel) {
+    // per-notch probs for THIS reward (as the parent)
+    const perNotchParent = {};
+    for (const n of [1, 2, 3]) {
+      if (row.perNotch && row.perNotch[n]) {
+        // IMPORTANT: pass keys {mono, atLeast} for our bucket renderer
+        perNotchParent[n] = {
+          mono: row.perNotch[n].percentSingle,
+          atLeast: row.perNotch[n].percentAtLeastOneOfThree,
+        };
       }
-      tr.appendChild(tdOwned);
+    }
 
+    // row.selectOnceOnly matters for track aggregation of inner items
+    const onceOnlyParent = !!row.selectOnceOnly;
 
-        // Icon column
-        const tdIcon = document.createElement("td");
-        tdIcon.className = "px-2 py-2 text-center align-top w-[2.5rem]";
+    // Construire un mini "bucketSummaryRow" pour l'affichage du bloc récap
+    const pctsForTrack = [1, 2, 3].map(n => perNotchParent[n]?.atLeast || 0);
+    const trackPctBucket = trackAnyFromArray(pctsForTrack, onceOnlyParent);
 
-        const iconUrl = getIconForReward(row.rewardId);
-        const rarity = getRarityForReward(row.rewardId);
-        const rarityCls = rarityClass(rarity);
+    const bucketSummaryRowObj = {
+      bucketName: bucketId,
+      label: bucketId,
+      qty: "—",
+      minRoll: "—",
+      perNotch: {
+        1: perNotchParent[1]
+          ? { mono: perNotchParent[1].mono, atLeast: perNotchParent[1].atLeast }
+          : null,
+        2: perNotchParent[2]
+          ? { mono: perNotchParent[2].mono, atLeast: perNotchParent[2].atLeast }
+          : null,
+        3: perNotchParent[3]
+          ? { mono: perNotchParent[3].mono, atLeast: perNotchParent[3].atLeast }
+          : null,
+      },
+      trackPct: trackPctBucket,
+    };
 
-        // est-ce que c'est un LTID ? (rollOnPresent true et lootTableId présent)
-        // et pas d'icône trouvée
-        const metaForRow = window.PVP_REWARD_META?.[row.rewardId] || {};
-        const isLT = !!(metaForRow.rollOnPresent && metaForRow.lootTableId && !iconUrl);
-        const isLB = !!(metaForRow.directBucketId && !iconUrl);
+    return buildBucketItemsHTMLMulti(
+      bucketId,
+      playerLevel,
+      perNotchParent,
+      onceOnlyParent,
+      bucketSummaryRowObj
+    );
+  }
 
-        tdIcon.innerHTML = `
-        <div class="icon-wrap ${rarityCls}">
-            ${
-            iconUrl
-                ? `<img src="${iconUrl}" alt="" />`
-                : (isLT ? `<span class="lt-badge">LT</span>`
-                      : (isLB ? `<span class="lt-badge">LB</span>` : ""))
-            }
-        </div>
-        `;
-        tr.appendChild(tdIcon);
-
-
-      // Item cell (clickable to expand loot table)
-      const tdItem = document.createElement("td");
-      tdItem.className = "px-2 py-2 break-words";
-      tdItem.textContent = row.displayName;
-
-      let detailsTr = null;
-      if (row.rollOnPresent && row.lootTableId) {
-        tdItem.classList.add(
-          "cursor-pointer",
-          "text-indigo-300",
-          "underline",
-          "decoration-dotted",
-          "hover:text-indigo-200"
-        );
-        tdItem.setAttribute("tabindex", "0");
-        tdItem.setAttribute("role", "button");
-
-        detailsTr = document.createElement("tr");
-        detailsTr.className = "bg-slate-900/60 hidden";
-
-        const detailsTd = document.createElement("td");
-        // colSpan must span all columns in main table
-        detailsTd.colSpan = 14;
-        detailsTd.className = "px-6 py-4 text-xs";
-
-        // Build per-notch parent chances (for that reward only)
-        const perNotchParent = {};
-        for (const n of [1, 2, 3]) {
-          if (row.perNotch && row.perNotch[n]) {
-            perNotchParent[n] = {
-              percentSingle: row.perNotch[n].percentSingle,
-              percentAtLeastOneOfThree: row.perNotch[n].percentAtLeastOneOfThree,
-              selectOnceOnly: row.perNotch[n].selectOnceOnly === true,
-            };
+  // Construit (ou reconstruit) le bloc de détails d'une ligne.
+  // Appelé seulement à la première ouverture, ou si la ligne est ouverte
+  // et que ses probabilités ont changé.
+  function fillRowDetails(entry) {
+    const { row, playerLevel, trackLevel } = entry.ctx;
+
+    entry.detailsTd.innerHTML = (entry.detailsKind === "lt")
+      ? buildLootTableDetailsForRow(row, playerLevel, trackLevel)
+      : buildDirectBucketDetailsForRow(row, entry.directBucketId, playerLevel);
+
+    // keep LBID→final items toggles working
+    attachBucketRowToggles(entry.detailsTd);
+    entry.detailsTd
+      .querySelectorAll(".bucket-detail-table, .bucket-final-table")
+      .forEach(tbl => makeInnerTableSortable(tbl));
+
+    entry.detailsKey = detailsKeyFor(playerLevel, trackLevel, row);
+  }
+
+  function createMainRowEntry(rewardId) {
+    const entry = {
+      rewardId,
+      tr: null,
+      checkbox: null,
+      cells: {},
+      rendered: {},
+      detailsTr: null,
+      detailsTd: null,
+      detailsKind: null,   // "lt" | "lb" | null
+      directBucketId: null,
+      detailsKey: null,    // null = pas encore construit
+      ctx: null,           // { row, playerLevel, trackLevel } du dernier rendu
+    };
+
+    const tr = document.createElement("tr");
+    tr.className = "odd:bg-slate-800/40 even:bg-slate-800/20 align-top";
+    tr.id = `reward-${rewardId}`;
+    tr.setAttribute("data-reward-id", rewardId);
+    entry.tr = tr;
+
+    const metaForRow = window.PVP_REWARD_META?.[rewardId] || {};
+
+    // Owned? column (checkbox for cosmetics / artifacts)
+    const tdOwned = document.createElement("td");
+    tdOwned.className = "px-2 py-2 text-center align-top w-[2rem]";
+    if (metaForRow.uniqueEligible) {
+      const cb = document.createElement("input");
+      cb.type = "checkbox";
+      cb.className = "chk";
+      cb.setAttribute("aria-label", "Already owned?");
+      cb.addEventListener("click", (e) => {
+        e.stopPropagation();
+        toggleOwned(rewardId);
+        onOwnedToggled(rewardId);
+      });
+      tdOwned.appendChild(cb);
+      entry.checkbox = cb;
+    } else {
+      tdOwned.innerHTML = `<span class="text-slate-500 text-[11px]">—</span>`;
+    }
+    tr.appendChild(tdOwned);
+
+    // Icon column (ne dépend que des méta, construit une seule fois)
+    const tdIcon = document.createElement("td");
+    tdIcon.className = "px-2 py-2 text-center align-top w-[2.5rem]";
+
+    const iconUrl = getIconForReward(rewardId);
+    const rarityCls = rarityClass(getRarityForReward(rewardId));
+
+    // est-ce que c'est un LTID ? (rollOnPresent true et lootTableId présent)
+    // et pas d'icône trouvée
+    const isLT = !!(metaForRow.rollOnPresent && metaForRow.lootTableId && !iconUrl);
+    const isLB = !!(metaForRow.directBucketId && !iconUrl);
+
+    tdIcon.innerHTML = `
+      <div class="icon-wrap ${rarityCls}">
+          ${
+          iconUrl
+              ? `<img src="${iconUrl}" alt="" />`
+              : (isLT ? `<span class="lt-badge">LT</span>`
+                    : (isLB ? `<span class="lt-badge">LB</span>` : ""))
           }
+      </div>
+      `;
+    tr.appendChild(tdIcon);
+
+    // Item cell (clickable to expand loot table / bucket)
+    const tdItem = document.createElement("td");
+    tdItem.className = "px-2 py-2 break-words";
+    tdItem.textContent = getDisplayName(rewardId);
+
+    if (metaForRow.rollOnPresent && metaForRow.lootTableId) {
+      entry.detailsKind = "lt";
+    } else if (metaForRow.directBucketId && window.PVP_BUCKET_CONTENTS?.[metaForRow.directBucketId]) {
+      entry.detailsKind = "lb";
+      entry.directBucketId = metaForRow.directBucketId;
+    }
+
+    if (entry.detailsKind) {
+      tdItem.classList.add(...DRILL_CLASSES);
+      tdItem.setAttribute("tabindex", "0");
+      tdItem.setAttribute("role", "button");
+
+      const detailsTr = document.createElement("tr");
+      detailsTr.className = "bg-slate-900/60 hidden";
+
+      const detailsTd = document.createElement("td");
+      // colSpan must span all columns in main table
+      detailsTd.colSpan = 14;
+      detailsTd.className = "px-6 py-4 text-xs";
+      detailsTr.appendChild(detailsTd);
+
+      entry.detailsTr = detailsTr;
+      entry.detailsTd = detailsTd;
+
+      // le contenu n'est construit qu'à la première ouverture
+      const toggle = (ev) => {
+        if (ev?.type === "keypress" && ev.key !== "Enter" && ev.key !== " ")
+          return;
+        detailsTr.classList.toggle("hidden");
+        if (!detailsTr.classList.contains("hidden") && entry.detailsKey === null) {
+          fillRowDetails(entry);
         }
+      };
 
-        detailsTd.innerHTML = buildLootDetailsHTMLMulti(
-          row.lootTableId,
-          playerLevel,
-          trackLevel,
-          perNotchParent
-        );
-
-        detailsTr.appendChild(detailsTd);
-
-        const toggle = (ev) => {
-          if (ev?.type === "keypress" && ev.key !== "Enter" && ev.key !== " ")
-            return;
-          detailsTr.classList.toggle("hidden");
-          if (!detailsTr.classList.contains("hidden")) {
-            attachBucketRowToggles(detailsTd);
-          }
-        };
+      tdItem.addEventListener("click", toggle);
+      tdItem.addEventListener("keypress", toggle);
+    }
+    tr.appendChild(tdItem);
+
+    // Azoth Salt column
+    const tdCost = document.createElement("td");
+    tdCost.className = "px-2 py-2 text-center align-top";
+    tr.appendChild(tdCost);
+    entry.cells.cost = tdCost;
 
-        tdItem.addEventListener("click", toggle);
-        tdItem.addEventListener("keypress", toggle);
+    // 3x triplets of columns for Notch1/Notch2/Notch3:
+    // Weight / %single / %≥1/3
+    for (const notch of [1, 2, 3]) {
+      for (const col of ["w", "mono", "atLeast"]) {
+        const td = document.createElement("td");
+        td.className = "px-2 py-2 text-right align-top";
+        tr.appendChild(td);
+        entry.cells[`n${notch}${col}`] = td;
       }
-      if (!detailsTr && metaForRow.directBucketId && window.PVP_BUCKET_CONTENTS?.[metaForRow.directBucketId]) {
-        tdItem.classList.add(
-          "cursor-pointer",
-          "text-indigo-300",
-          "underline",
-          "decoration-dotted",
-          "hover:text-indigo-200"
-        );
-        tdItem.setAttribute("tabindex", "0");
-        tdItem.setAttribute("role", "button");
-
-        detailsTr = document.createElement("tr");
-        detailsTr.className = "bg-slate-900/60 hidden";
-
-        const detailsTd = document.createElement("td");
-        // use the same total colSpan as your current table (likely 15 with the Icon column)
-        detailsTd.colSpan = 14;
-        detailsTd.className = "px-6 py-4 text-xs";
-
-        // per-notch probs for THIS reward (as the parent)
-        const perNotchParent = {};
-        for (const n of [1, 2, 3]) {
-          if (row.perNotch && row.perNotch[n]) {
-            // IMPORTANT: pass keys {mono, atLeast} for our bucket renderer
-            perNotchParent[n] = {
-              mono: row.perNotch[n].percentSingle,
-              atLeast: row.perNotch[n].percentAtLeastOneOfThree,
-            };
-          }
-        }
+    }
 
-        // row.selectOnceOnly matters for track aggregation of inner items
-        const onceOnlyParent = !!row.selectOnceOnly;
-
-        // Construire un mini "bucketSummaryRow" pour l'affichage du bloc récap
-        const pctsForTrack = [1, 2, 3].map(n => perNotchParent[n]?.atLeast || 0);
-        const trackPctBucket = trackAnyFromArray(pctsForTrack, onceOnlyParent);
-
-        const bucketSummaryRowObj = {
-          bucketName: metaForRow.directBucketId,
-          label: metaForRow.directBucketId,
-          qty: "—",
-          minRoll: "—",
-          perNotch: {
-            1: perNotchParent[1]
-              ? { mono: perNotchParent[1].mono, atLeast: perNotchParent[1].atLeast }
-              : null,
-            2: perNotchParent[2]
-              ? { mono: perNotchParent[2].mono, atLeast: perNotchParent[2].atLeast }
-              : null,
-            3: perNotchParent[3]
-              ? { mono: perNotchParent[3].mono, atLeast: perNotchParent[3].atLeast }
-              : null,
-          },
-          trackPct: trackPctBucket,
-        };
+    // Track1/9 column (green)
+    const tdTrack = document.createElement("td");
+    tdTrack.className = "px-2 py-2 text-right align-top";
+    tr.appendChild(tdTrack);
+    entry.cells.track = tdTrack;
 
-        detailsTd.innerHTML = buildBucketItemsHTMLMulti(
-          metaForRow.directBucketId,
-          playerLevel,
-          perNotchParent,
-          onceOnlyParent,
-          bucketSummaryRowObj
-        );
-
-        detailsTr.appendChild(detailsTd);
-
-        const toggle = (ev) => {
-          if (ev?.type === "keypress" && ev.key !== "Enter" && ev.key !== " ") return;
-          detailsTr.classList.toggle("hidden");
-          if (!detailsTr.classList.contains("hidden")) {
-            attachBucketRowToggles(detailsTd); // keep LBID→final items toggles working
-          }
-        };
+    return entry;
+  }
+
+  function updateMainRowEntry(entry, row, playerLevel, trackLevel, ownedSet) {
+    entry.ctx = { row, playerLevel, trackLevel };
+
+    if (entry.checkbox) {
+      entry.checkbox.checked = ownedSet.has(row.rewardId);
+    }
+
+    patchCellHTML(entry, "cost", entry.cells.cost,
+      String(row.cost ?? "—") + planNoteHTML(row.rewardId, trackLevel, ownedSet.has(row.rewardId)));
+
+    for (const notch of [1, 2, 3]) {
+      const d = row.perNotch[notch];
+      const w = d?.weight;
+      const pMono = d?.percentSingle;
+      const pAtLeast = d?.percentAtLeastOneOfThree;
+
+      patchCellText(entry, `n${notch}w`, entry.cells[`n${notch}w`], w ?? "—");
+      patchCellHTML(entry, `n${notch}mono`, entry.cells[`n${notch}mono`],
+        pMono != null ? pctSpan(pMono, notch) : "—");
+      patchCellHTML(entry, `n${notch}atLeast`, entry.cells[`n${notch}atLeast`],
+        pAtLeast != null ? pctSpan(pAtLeast, notch) : "—");
+    }
+
+    patchCellHTML(entry, "track", entry.cells.track, pctTrackSpan(row.trackPct));
+
+    // Détails déjà construits mais devenus obsolètes :
+    // - ligne ouverte -> on reconstruit tout de suite
+    // - ligne fermée  -> on jette, ce sera reconstruit à la prochaine ouverture
+    if (entry.detailsTr && entry.detailsKey !== null
+        && entry.detailsKey !== detailsKeyFor(playerLevel, trackLevel, row)) {
+      if (entry.detailsTr.classList.contains("hidden")) {
+        entry.detailsTd.innerHTML = "";
+        entry.detailsKey = null;
+      } else {
+        fillRowDetails(entry);
+      }
+    }
+  }
+
+  function renderMergedRows(playerLevel, trackLevel, rows) {
+    const tbody = document.getElementById("resultsBodyAll");
+    if (!tbody) return;
+
+    const ownedSet = getOwnedSet();
 
-        tdItem.addEventListener("click", toggle);
-        tdItem.addEventListener("keypress", toggle);
+    for (const row of rows) {
+      let entry = MAIN_ROW_CACHE.get(row.rewardId);
+      if (!entry) {
+        entry = createMainRowEntry(row.rewardId);
+        MAIN_ROW_CACHE.set(row.rewardId, entry);
       }
+      updateMainRowEntry(entry, row, playerLevel, trackLevel, ownedSet);
+    }
+    placeMainRows(tbody, rows);
+  }
+
+  function placeMainRows(tbody, rows) {
+    // On place les nœuds dans l'ordre voulu en ne déplaçant
+    // que ceux qui ne sont pas déjà à la bonne position.
+    let cursor = tbody.firstChild;
+    const place = (node) => {
+      if (node === cursor) {
+        cursor = cursor.nextSibling;
+      } else {
+        tbody.insertBefore(node, cursor);
+      }
+    };
+
+    for (const row of rows) {
+      const entry = MAIN_ROW_CACHE.get(row.rewardId);
+      place(entry.tr);
+      if (entry.detailsTr) place(entry.detailsTr);
+    }
+
+    // tout ce qui reste après le curseur n'est plus dans le résultat
+    // (les entrées restent en cache pour être réutilisées plus tard)
+    while (cursor) {
+      const next = cursor.nextSibling;
+      tbody.removeChild(cursor);
+      cursor = next;
+    }
+  }
+
+  // ----------------- Owned toggle (incrémental) -----------------
+
+  // Dernier rendu complet : un toggle "owned" repart de ces lignes.
+  let LAST_CALC = null; // { playerLevel, trackLevel, rows }
 
-      tr.appendChild(tdItem);
-
-      // Azoth Salt column
-      const tdCost = document.createElement("td");
-      tdCost.className = "px-2 py-2 text-center align-top";
-      tdCost.textContent = row.cost ?? "—";
-      tr.appendChild(tdCost);
-
-
-      // 3x triplets of columns for Notch1/Notch2/Notch3:
-      // Weight / %single / %≥1/3
-      for (const notch of [1, 2, 3]) {
-        const d = row.perNotch[notch];
-        const w = d?.weight;
-        const pMono = d?.percentSingle;
-        const pAtLeast = d?.percentAtLeastOneOfThree;
-
-        const tdW = document.createElement("td");
-        tdW.className = "px-2 py-2 text-right align-top";
-        tdW.textContent = w ?? "—";
-        tr.appendChild(tdW);
-
-        const tdMono = document.createElement("td");
-        tdMono.className = "px-2 py-2 text-right align-top";
-        tdMono.innerHTML = pMono != null ? pctSpan(pMono, notch) : "—";
-        tr.appendChild(tdMono);
-
-        const tdAtLeast = document.createElement("td");
-        tdAtLeast.className = "px-2 py-2 text-right align-top";
-        tdAtLeast.innerHTML = pAtLeast != null ? pctSpan(pAtLeast, notch) : "—";
-        tr.appendChild(tdAtLeast);
+  // Clés de tri qui dépendent des % (donc d'un toggle)
+  const ODDS_SORT_KEYS = new Set([
+    "n1PctSingle", "n1PctAny", "n2PctSingle", "n2PctAny",
+    "n3PctSingle", "n3PctAny", "trackPct",
+  ]);
+
+  // Après toggleOwned() : applyOwnedDelta a déjà rescalé les notch qui
+  // contiennent la récompense, on ne repatche que les lignes de ces notch
+  // (+ liste owned et cartes récap) au lieu de tout reconstruire.
+  function onOwnedToggled(rewardId) {
+    const cls = LAST_CALC ? levelClassOf(LAST_CALC.trackLevel) : null;
+    if (cls === null) {
+      onCalc(); // data.js sans PVP_OWNED_INDEX : recalcul complet
+      return;
+    }
+    const { playerLevel, trackLevel } = LAST_CALC;
+
+    const notches = [...new Set((window.PVP_OWNED_INDEX.unique?.[rewardId] || [])
+      .filter(([c]) => c === cls)
+      .map(([, notch]) => notch))];
+
+    renderOwnedList();
+    if (!notches.length) return; // absente de ce niveau : rien d'autre ne bouge
+
+    const dists = {
+      1: getNotchDistCached(cls, 1),
+      2: getNotchDistCached(cls, 2),
+      3: getNotchDistCached(cls, 3),
+    };
+    renderSummaryCards(playerLevel, trackLevel, dists[1], dists[2], dists[3]);
+
+    // nouvelles stats des notch touchées : rid -> { notch -> stats }
+    const fresh = new Map();
+    for (const n of notches) {
+      for (const k of dists[n].rewards) {
+        if (!fresh.has(k.rewardId)) fresh.set(k.rewardId, {});
+        fresh.get(k.rewardId)[n] = notchStats(k);
       }
+    }
 
-      // Track1/9 column (green)
-      const tdTrack = document.createElement("td");
-      tdTrack.className = "px-2 py-2 text-right align-top";
-      tdTrack.innerHTML = pctTrackSpan(row.trackPct);
-      tr.appendChild(tdTrack);
+    const touched = [];
+    const dropped = [];
+    const rows = [];
+    let added = false;
+    for (const row of LAST_CALC.rows) {
+      const stats = fresh.get(row.rewardId);
+      if (row.rewardId !== rewardId && !stats) {
+        rows.push(row);
+        continue;
+      }
+      fresh.delete(row.rewardId);
+      for (const n of notches) {
+        if (stats?.[n]) row.perNotch[n] = stats[n];
+        else delete row.perNotch[n];
+      }
+      if (!Object.keys(row.perNotch).length) { // plus proposée nulle part
+        dropped.push(row.rewardId);
+        continue;
+      }
+      setRowOdds(row);
+      rows.push(row);
+      touched.push(row);
+    }
+    // la récompense revient (plus possédée) : une seule ligne à construire
+    for (const [rid, perNotch] of fresh) {
+      const once = Object.values(perNotch).some(d => d.selectOnceOnly);
+      const row = buildRowFor(rid, perNotch, once, playerLevel, trackLevel);
+      rows.push(row);
+      touched.push(row);
+      added = true;
+    }
 
-      tbody.appendChild(tr);
-      if (detailsTr) tbody.appendChild(detailsTr);
-      document.querySelectorAll(".bucket-detail-table, .bucket-final-table")
-        .forEach(tbl => makeInnerTableSortable(tbl));
+    const ownedSet = getOwnedSet();
+    for (const row of touched) {
+      let entry = MAIN_ROW_CACHE.get(row.rewardId);
+      if (!entry) {
+        entry = createMainRowEntry(row.rewardId);
+        MAIN_ROW_CACHE.set(row.rewardId, entry);
+      }
+      updateMainRowEntry(entry, row, playerLevel, trackLevel, ownedSet);
+    }
 
+    // l'ordre ne peut changer que si le tri porte sur les % ou si une ligne revient
+    const tbody = document.getElementById("resultsBodyAll");
+    if (added || ODDS_SORT_KEYS.has(SORT_KEY)) {
+      LAST_CALC.rows = sortMainRows(rows);
+      if (tbody) placeMainRows(tbody, LAST_CALC.rows);
+    } else {
+      LAST_CALC.rows = rows;
+      for (const rid of dropped) {
+        const entry = MAIN_ROW_CACHE.get(rid);
+        entry?.tr.remove();
+        entry?.detailsTr?.remove();
+      }
     }
   }
 
@@ -1613,6 +2036,19 @@ function buildMergedRows(playerLevel, trackLevel, d1, d2, d3) {
     const distAll = buildAllNotchDists(tLvl, pLvl);
     const { d1, d2, d3 } = distAll;
 
+    renderSummaryCards(pLvl, tLvl, d1, d2, d3);
+
+    // Construit toutes les lignes fusionnées avec stats Notch1/2/3
+    const baseRows = buildMergedRows(pLvl, tLvl, d1, d2, d3);
+    const sortrows = sortMainRows(baseRows);
+
+    renderMergedRows(pLvl, tLvl, sortrows);
+    renderOwnedList();
+    LAST_CALC = { playerLevel: pLvl, trackLevel: tLvl, rows: sortrows };
+  }
+
+  // Cartes récap du haut (Player / Notch1 / Notch2 / Notch3)
+  function renderSummaryCards(pLvl, tLvl, d1, d2, d3) {
     // Compte des récompenses uniques proposées dans ce track
     const uniqueIds = new Set([
       ...d1.rewards.map(r => r.rewardId),
@@ -1620,7 +2056,6 @@ function buildMergedRows(playerLevel, trackLevel, d1, d2, d3) {
       ...d3.rewards.map(r => r.rewardId),
     ]);
 
-    // Cartes récap du haut (Player / Notch1 / Notch2 / Notch3)
     const metaTop = document.getElementById("resultMeta");
     if (metaTop) {
       metaTop.innerHTML = `
@@ -1660,13 +2095,6 @@ function buildMergedRows(playerLevel, trackLevel, d1, d2, d3) {
         </div>
       `;
     }
-
-    // Construit toutes les lignes fusionnées avec stats Notch1/2/3
-    const baseRows = buildMergedRows(pLvl, tLvl, d1, d2, d3);
-    const sortrows = sortMainRows(baseRows);
-
-    renderMergedRows(pLvl, tLvl, sortrows);
-    renderOwnedList();
   }
 
 // ----------------- SEARCH (name or ID → jump & expand) -----------------
@@ -1834,10 +2262,15 @@ function expandBucket(detailsRoot, lbId) {
   const toggles = Array.from(detailsRoot.querySelectorAll(".lb-toggle"));
   const toggle = toggles.find(t => (t.textContent || "").trim() === lbId);
   if (toggle) {
-    toggle.click(); // reveal nested item list
     const targetId = toggle.getAttribute("data-target");
+    const row = targetId
+      ? detailsRoot.querySelector(`#${CSS?.escape ? CSS.escape(targetId) : targetId}`)
+      : null;
+    // les lignes sont réutilisées entre deux rendus : ne pas refermer un bucket déjà ouvert
+    if (!row || row.classList.contains("hidden")) {
+      toggle.click(); // reveal nested item list
+    }
     if (targetId) {
-      const row = detailsRoot.querySelector(`#${CSS?.escape ? CSS.escape(targetId) : targetId}`);
       return row || detailsRoot;
     }
   }
@@ -1874,9 +2307,11 @@ function jumpTo({ rewardId, ltId, lbId, itemName, itemId }) {
   smoothScrollIntoView(rewardRow);
   highlight(rewardRow);
 
-  // 2) Open details (name cell toggler)
+  // 2) Open details (name cell toggler), unless the reused row is already open
   const clickableNameCell = rewardRow.querySelector('[role="button"], .cursor-pointer');
-  if (clickableNameCell) clickableNameCell.click();
+  const openDetails = rewardRow.nextElementSibling?.classList?.contains("bg-slate-900/60")
+    && !rewardRow.nextElementSibling.classList.contains("hidden");
+  if (clickableNameCell && !openDetails) clickableNameCell.click();
 
   // 3) Wait one frame so the details row gets injected
   requestAnimationFrame(() => {
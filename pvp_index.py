@@ -0,0 +1,612 @@
+import os
+import sys
+import mmap
+import struct
+import argparse
+
+# --------- Binary index layout
+#
+# Fixed-layout, little-endian file written next to data.js by build_data.py.
+# Readers mmap it and answer by offset arithmetic only (no JSON parse), so
+# startup is a few ms and the pages are shared between concurrent processes.
+#
+#   header   : magic, format version, section count
+#   sections : (offset, count) per section, in the SEC_* order below
+#
+# Strings are stored once, sorted, and referenced by their index ("sid").
+# Since the table is sorted, lookups by name are a binary search, and every
+# record section keyed by a sid is sorted by that sid as well.
+
+MAGIC = b"NWPVPIDX"
+FORMAT_VERSION = 3   # bump on ANY layout change: old files are then rejected
+
+NONE_SID = 0xFFFFFFFF
+
+HEADER = struct.Struct("<8sII")     # magic, version, n_sections
+SECTION = struct.Struct("<II")      # offset, count
+
+STR_OFF = struct.Struct("<I")       # byte offset into the blob (count + 1 entries)
+NOTCH = struct.Struct("<III")       # totalWeight, first dist, dist count   [level * 3 + notch - 1]
+DIST = struct.Struct("<IIIdd")      # reward sid, weight, flags, percentSingle, percentAtLeastOneOfThree
+REWARD = struct.Struct("<IIIIiII")  # reward sid, name sid, lootTable sid, directBucket sid, buyCost, buyCurrency sid, flags
+LOOT = struct.Struct("<IIII")       # table sid, condition sid, first tier, tier count
+TIER = struct.Struct("<iII")        # min, gsRange sid, subTable sid
+BUCKET = struct.Struct("<III")      # bucket sid, first item, item count
+BITEM = struct.Struct("<IIiIIII")   # item sid, displayName sid, qty, qty text sid, tags sid, icon sid, rarity sid
+ITEMPOST = struct.Struct("<II")     # item sid, bucket record index
+
+(SEC_STR_OFFS, SEC_STR_BLOB, SEC_NOTCH, SEC_DIST, SEC_REWARD,
+ SEC_LOOT, SEC_TIER, SEC_BUCKET, SEC_BITEM, SEC_ITEMPOST) = range(10)
+N_SECTIONS = 10
+
+# bytes per record of each section, for the bounds check on open
+# (the blob's count is already in bytes; the string offsets have count + 1 entries)
+SECTION_RECORD_SIZE = (STR_OFF.size, 1, NOTCH.size, DIST.size, REWARD.size,
+                       LOOT.size, TIER.size, BUCKET.size, BITEM.size, ITEMPOST.size)
+
+# DIST flags
+F_SELECT_ONCE = 1
+# REWARD flags
+F_UNIQUE = 1
+F_ROLL_ON_PRESENT = 2
+F_SKIN = 4
+
+NO_COST = -1
+# BITEM qty: NO_QTY + a qty text sid for ranges like "1-2", NO_QTY + NONE_SID for None
+NO_QTY = -1
+
+
+class IndexFormatError(ValueError):
+    """The file is not a PvP index, or was written by another format version."""
+
+
+# --------- Helpers
+
+def track_any(pcts, once_only):
+    """
+    Same as trackAnyFromArray() in pvp.js: chance (in %) to get a reward at
+    least once over the 3 notches, given its per-notch "≥1 of 3" chances.
+    """
+    p1, p2, p3 = ((p or 0) / 100.0 for p in pcts)
+    if once_only:
+        total = p1 + (1 - p1) * p2 + (1 - p1) * (1 - p2) * p3
+    else:
+        total = 1 - (1 - p1) * (1 - p2) * (1 - p3)
+    return total * 100.0
+
+def _as_cost(v):
+    try:
+        return int(v)
+    except Exception:
+        return NO_COST
+
+def _split_qty(v):
+    """(int qty, qty text) for a bucket item: ints stay ints, anything else is text."""
+    if isinstance(v, int) and not isinstance(v, bool) and v >= 0:
+        return v, ""
+    return NO_QTY, _as_text(v)
+
+def _as_text(v):
+    if v is None:
+        return ""
+    if isinstance(v, (list, tuple)):
+        return ",".join(str(x) for x in v)
+    return str(v)
+
+
+# --------- WRITE
+
+def write_binary_index(path, PVP_DATA, PVP_REWARD_META, PVP_LOOT_TABLES, bucket_contents):
+    """
+    Serialize the build outputs into the fixed-layout index at `path`.
+    Written to a temp file then renamed, so running readers keep a valid map.
+    """
+    strings = set()
+
+    def want(s):
+        if s:
+            strings.add(s)
+
+    for notches in PVP_DATA.values():
+        for d in notches.values():
+            for r in d["rewards"]:
+                want(r["rewardId"])
+
+    for rid, meta in PVP_REWARD_META.items():
+        want(rid)
+        want(meta.get("name") or "")
+        want(meta.get("lootTableId") or "")
+        want(meta.get("directBucketId") or "")
+        want(meta.get("buyCurrency") or "")
+
+    for tid, table in PVP_LOOT_TABLES.items():
+        want(tid)
+        want(_as_text(table.get("condition")))
+        for t in table.get("tiers", []):
+            want(_as_text(t.get("gsRange")))
+            want(t.get("subTable") or "")
+
+    for bname, items in bucket_contents.items():
+        want(bname)
+        for it in items:
+            want(_as_text(it.get("itemId")))
+            want(_as_text(it.get("displayName")))
+            want(_split_qty(it.get("qty"))[1])
+            want(_as_text(it.get("tags")))
+            want(it.get("icon") or "")
+            want(it.get("rarity") or "")
+
+    # code point order == UTF-8 byte order, which is what the reader compares
+    str_list = sorted(strings)
+    sid_of = {s: i for i, s in enumerate(str_list)}
+
+    def sid(s):
+        return sid_of[s] if s else NONE_SID
+
+    sections = [bytearray() for _ in range(N_SECTIONS)]
+    counts = [0] * N_SECTIONS
+
+    # strings
+    blob = sections[SEC_STR_BLOB]
+    for s in str_list:
+        sections[SEC_STR_OFFS] += STR_OFF.pack(len(blob))
+        blob += s.encode("utf-8")
+    sections[SEC_STR_OFFS] += STR_OFF.pack(len(blob))
+    counts[SEC_STR_OFFS] = len(str_list)
+    counts[SEC_STR_BLOB] = len(blob)
+
+    # per-level distributions (levels are 0..max, missing ones stay empty)
+    n_levels = max(int(k) for k in PVP_DATA) + 1 if PVP_DATA else 0
+    n_dist = 0
+    for lvl in range(n_levels):
+        for notch in (1, 2, 3):
+            d = PVP_DATA.get(str(lvl), {}).get(str(notch)) or {"totalWeight": 0, "rewards": []}
+            rewards = d["rewards"]
+            sections[SEC_NOTCH] += NOTCH.pack(d["totalWeight"], n_dist, len(rewards))
+            for r in rewards:
+                flags = F_SELECT_ONCE if r.get("selectOnceOnly") else 0
+                sections[SEC_DIST] += DIST.pack(
+                    sid(r["rewardId"]), r["weight"], flags,
+                    r["percentSingle"], r["percentAtLeastOneOfThree"],
+                )
+            n_dist += len(rewards)
+    counts[SEC_NOTCH] = n_levels * 3
+    counts[SEC_DIST] = n_dist
+
+    # reward meta
+    for rid in sorted(PVP_REWARD_META, key=sid):
+        meta = PVP_REWARD_META[rid]
+        flags = ((F_UNIQUE if meta.get("uniqueEligible") else 0)
+                 | (F_ROLL_ON_PRESENT if meta.get("rollOnPresent") else 0)
+                 | (F_SKIN if meta.get("isSkin") else 0))
+        sections[SEC_REWARD] += REWARD.pack(
+            sid(rid),
+            sid(meta.get("name") or ""),
+            sid(meta.get("lootTableId") or ""),
+            sid(meta.get("directBucketId") or ""),
+            _as_cost(meta.get("buyCost")),
+            sid(meta.get("buyCurrency") or ""),
+            flags,
+        )
+    counts[SEC_REWARD] = len(PVP_REWARD_META)
+
+    # loot-table tiers
+    n_tiers = 0
+    for tid in sorted(PVP_LOOT_TABLES, key=sid):
+        table = PVP_LOOT_TABLES[tid]
+        tiers = table.get("tiers", [])
+        sections[SEC_LOOT] += LOOT.pack(sid(tid), sid(_as_text(table.get("condition"))), n_tiers, len(tiers))
+        for t in tiers:
+            sections[SEC_TIER] += TIER.pack(
+                int(t.get("min") or 0),
+                sid(_as_text(t.get("gsRange"))),
+                sid(t.get("subTable") or ""),
+            )
+        n_tiers += len(tiers)
+    counts[SEC_LOOT] = len(PVP_LOOT_TABLES)
+    counts[SEC_TIER] = n_tiers
+
+    # bucket slices + item -> bucket postings
+    n_items = 0
+    postings = set()
+    for b_idx, bname in enumerate(sorted(bucket_contents, key=sid)):
+        items = bucket_contents[bname]
+        sections[SEC_BUCKET] += BUCKET.pack(sid(bname), n_items, len(items))
+        for it in items:
+            item_sid = sid(_as_text(it.get("itemId")))
+            qty, qty_text = _split_qty(it.get("qty"))
+            sections[SEC_BITEM] += BITEM.pack(
+                item_sid,
+                sid(_as_text(it.get("displayName"))),
+                qty,
+                sid(qty_text),
+                sid(_as_text(it.get("tags"))),
+                sid(it.get("icon") or ""),
+                sid(it.get("rarity") or ""),
+            )
+            if item_sid != NONE_SID:
+                postings.add((item_sid, b_idx))
+        n_items += len(items)
+    for item_sid, b_idx in sorted(postings):
+        sections[SEC_ITEMPOST] += ITEMPOST.pack(item_sid, b_idx)
+    counts[SEC_BUCKET] = len(bucket_contents)
+    counts[SEC_BITEM] = n_items
+    counts[SEC_ITEMPOST] = len(postings)
+
+    # layout: header, section table, then each section 8-byte aligned
+    offset = HEADER.size + SECTION.size * N_SECTIONS
+    table = bytearray()
+    for i in range(N_SECTIONS):
+        offset += -offset % 8
+        table += SECTION.pack(offset, counts[i])
+        offset += len(sections[i])
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, N_SECTIONS))
+        f.write(table)
+        for i in range(N_SECTIONS):
+            f.write(b"\0" * (-f.tell() % 8))
+            f.write(sections[i])
+    os.replace(tmp_path, path)
+    return path
+
+
+# --------- READ
+
+class PvpIndex:
+    """
+    Read-only view over an index file. Every lookup is a binary search or a
+    direct record read on the mmap; nothing is decoded up front.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise IndexFormatError(f"{path}: truncated index (rebuild it with build_data.py)")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        mm = self._mm
+        magic, version, n_sections = HEADER.unpack_from(mm, 0)
+        if magic != MAGIC:
+            raise IndexFormatError(f"{path}: not a PvP index")
+        if version != FORMAT_VERSION or n_sections != N_SECTIONS:
+            raise IndexFormatError(
+                f"{path}: index format v{version}, expected v{FORMAT_VERSION} "
+                f"(stale file, rebuild it with build_data.py)"
+            )
+
+        if len(mm) < HEADER.size + SECTION.size * N_SECTIONS:
+            raise IndexFormatError(f"{path}: truncated index (rebuild it with build_data.py)")
+        self._sec = [SECTION.unpack_from(mm, HEADER.size + i * SECTION.size)
+                     for i in range(N_SECTIONS)]
+        for i, (offset, count) in enumerate(self._sec):
+            n = count + 1 if i == SEC_STR_OFFS else count
+            if offset + n * SECTION_RECORD_SIZE[i] > len(mm):
+                raise IndexFormatError(f"{path}: truncated index (rebuild it with build_data.py)")
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- raw access
+
+    def _count(self, sec):
+        return self._sec[sec][1]
+
+    def _record(self, sec, rec, i):
+        return rec.unpack_from(self._mm, self._sec[sec][0] + i * rec.size)
+
+    def _string_bytes(self, sid):
+        offs, _ = self._sec[SEC_STR_OFFS]
+        blob, _ = self._sec[SEC_STR_BLOB]
+        a, b = struct.unpack_from("<II", self._mm, offs + sid * STR_OFF.size)
+        return self._mm[blob + a:blob + b]
+
+    def string(self, sid):
+        if sid == NONE_SID:
+            return ""
+        return self._string_bytes(sid).decode("utf-8")
+
+    def find_string(self, s):
+        """sid of `s`, or None."""
+        key = s.encode("utf-8")
+        lo, hi = 0, self._count(SEC_STR_OFFS)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._string_bytes(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count(SEC_STR_OFFS) and self._string_bytes(lo) == key:
+            return lo
+        return None
+
+    def _lower_bound(self, sec, rec, key_sid):
+        """First record index whose leading sid field is >= key_sid."""
+        lo, hi = 0, self._count(sec)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._record(sec, rec, mid)[0] < key_sid:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _find(self, sec, rec, name):
+        sid = self.find_string(name)
+        if sid is None:
+            return None
+        i = self._lower_bound(sec, rec, sid)
+        if i < self._count(sec):
+            r = self._record(sec, rec, i)
+            if r[0] == sid:
+                return i, r
+        return None
+
+    # --- queries
+
+    @property
+    def n_levels(self):
+        return self._count(SEC_NOTCH) // 3
+
+    def notch(self, level, notch):
+        """Same shape as PVP_DATA[level][notch]."""
+        if not (0 <= level < self.n_levels) or notch not in (1, 2, 3):
+            raise IndexError(f"no distribution for level {level} / notch {notch}")
+        total, first, count = self._record(SEC_NOTCH, NOTCH, level * 3 + notch - 1)
+        rewards = []
+        for i in range(first, first + count):
+            rsid, w, flags, p_single, p_any = self._record(SEC_DIST, DIST, i)
+            rewards.append({
+                "rewardId": self.string(rsid),
+                "weight": w,
+                "selectOnceOnly": bool(flags & F_SELECT_ONCE),
+                "percentSingle": p_single,
+                "percentAtLeastOneOfThree": p_any,
+            })
+        return {"totalWeight": total, "rewards": rewards}
+
+    def reward(self, reward_id):
+        """Subset of PVP_REWARD_META[reward_id], or None."""
+        found = self._find(SEC_REWARD, REWARD, reward_id)
+        if not found:
+            return None
+        _, (rsid, name, lt, lb, cost, currency, flags) = found
+        return {
+            "rewardId": self.string(rsid),
+            "name": self.string(name),
+            "lootTableId": self.string(lt) or None,
+            "directBucketId": self.string(lb) or None,
+            "buyCost": None if cost == NO_COST else cost,
+            "buyCurrency": self.string(currency),
+            "uniqueEligible": bool(flags & F_UNIQUE),
+            "rollOnPresent": bool(flags & F_ROLL_ON_PRESENT),
+            "isSkin": bool(flags & F_SKIN),
+        }
+
+    def reward_odds(self, reward_id, level):
+        """Per-notch entries for a reward at a track level, plus the %Track1/9 value."""
+        if not (0 <= level < self.n_levels):
+            raise IndexError(f"no distribution for level {level}")
+        sid = self.find_string(reward_id)
+        per_notch = {}
+        once_only = False
+        for notch in (1, 2, 3):
+            total, first, count = self._record(SEC_NOTCH, NOTCH, level * 3 + notch - 1)
+            for i in range(first, first + count):
+                rsid, w, flags, p_single, p_any = self._record(SEC_DIST, DIST, i)
+                if rsid == sid:
+                    per_notch[notch] = {
+                        "weight": w,
+                        "totalWeight": total,
+                        "percentSingle": p_single,
+                        "percentAtLeastOneOfThree": p_any,
+                    }
+                    once_only = once_only or bool(flags & F_SELECT_ONCE)
+                    break
+        pcts = [per_notch.get(n, {}).get("percentAtLeastOneOfThree", 0) for n in (1, 2, 3)]
+        return {
+            "perNotch": per_notch,
+            "selectOnceOnly": once_only,
+            "trackPct": track_any(pcts, once_only),
+        }
+
+    def loot_table(self, table_id):
+        """Same shape as PVP_LOOT_TABLES[table_id], or None."""
+        found = self._find(SEC_LOOT, LOOT, table_id)
+        if not found:
+            return None
+        _, (_, cond, first, count) = found
+        tiers = []
+        for i in range(first, first + count):
+            mn, gs, sub = self._record(SEC_TIER, TIER, i)
+            tiers.append({
+                "min": mn,
+                "gsRange": self.string(gs) or None,
+                "subTable": self.string(sub) or None,
+            })
+        return {"condition": self.string(cond) or None, "tiers": tiers}
+
+    def gs_range(self, table_id, player_level, track_level):
+        """
+        Same walk as resolveGsRangeFromLootTable() in pvp.js:
+        pick the best tier for Level / PvP_XP and follow subTables.
+        """
+        seen = set()
+        tid = table_id
+        while tid and tid not in seen:
+            seen.add(tid)
+            table = self.loot_table(tid)
+            if not table:
+                return None
+            cond = table["condition"] or "Level"
+            val = track_level if ("pvp" in cond.lower() and "xp" in cond.lower()) else player_level
+
+            best = None
+            for t in table["tiers"]:
+                if val >= t["min"] and (best is None or t["min"] > best["min"]):
+                    best = t
+            if not best:
+                return None
+            if best["gsRange"] and best["gsRange"] != "None":
+                return best["gsRange"]
+            tid = best["subTable"]
+        return None
+
+    def bucket(self, bucket_name):
+        """Same shape as PVP_BUCKET_CONTENTS[bucket_name], or None."""
+        found = self._find(SEC_BUCKET, BUCKET, bucket_name)
+        if not found:
+            return None
+        return self._bucket_items(found[1])
+
+    def _bucket_items(self, rec):
+        _, first, count = rec
+        items = []
+        for i in range(first, first + count):
+            item, disp, qty, qty_text, tags, icon, rarity = self._record(SEC_BITEM, BITEM, i)
+            tags_s = self.string(tags)
+            if qty_text != NONE_SID:
+                qty = self.string(qty_text)
+            elif qty == NO_QTY:
+                qty = None
+            items.append({
+                "itemId": self.string(item),
+                "qty": qty,
+                "tags": tags_s.split(",") if tags_s else [],
+                "displayName": self.string(disp),
+                "icon": self.string(icon),
+                "rarity": self.string(rarity),
+            })
+        return items
+
+    def buckets_for_item(self, item_id):
+        """Names of the buckets (LBID) that can drop `item_id`."""
+        sid = self.find_string(item_id)
+        if sid is None:
+            return []
+        out = []
+        i = self._lower_bound(SEC_ITEMPOST, ITEMPOST, sid)
+        while i < self._count(SEC_ITEMPOST):
+            item_sid, b_idx = self._record(SEC_ITEMPOST, ITEMPOST, i)
+            if item_sid != sid:
+                break
+            out.append(self.string(self._record(SEC_BUCKET, BUCKET, b_idx)[0]))
+            i += 1
+        return out
+
+    def rewards_for_bucket(self, bucket_name):
+        """RewardIDs that hand out this bucket directly (directBucketId)."""
+        sid = self.find_string(bucket_name)
+        if sid is None:
+            return []
+        out = []
+        for i in range(self._count(SEC_REWARD)):
+            r = self._record(SEC_REWARD, REWARD, i)
+            if r[3] == sid:
+                out.append(self.string(r[0]))
+        return out
+
+
+# --------- CLI
+
+def _fmt_pct(x):
+    return f"{x:.2f} %"
+
+def _cmd_reward(idx, args):
+    meta = idx.reward(args.id)
+    if not meta:
+        print(f"unknown reward: {args.id}", file=sys.stderr)
+        return 1
+
+    odds = idx.reward_odds(args.id, args.level)
+    print(f"{meta['rewardId']}  {meta['name']}")
+    cost = f"{meta['buyCost']} {meta['buyCurrency']}".strip() if meta["buyCost"] is not None else "—"
+    print(f"  track level {args.level}  buyCost {cost}")
+    if meta["lootTableId"]:
+        gs = idx.gs_range(meta["lootTableId"], args.player_level, args.level)
+        print(f"  loot table {meta['lootTableId']}  GS {gs or '—'} (player level {args.player_level})")
+    if meta["directBucketId"]:
+        print(f"  bucket {meta['directBucketId']}")
+    for notch in (1, 2, 3):
+        d = odds["perNotch"].get(notch)
+        if not d:
+            print(f"  notch {notch}: —")
+            continue
+        print(f"  notch {notch}: weight {d['weight']}/{d['totalWeight']}"
+              f"  single {_fmt_pct(d['percentSingle'])}"
+              f"  ≥1/3 {_fmt_pct(d['percentAtLeastOneOfThree'])}")
+    print(f"  %Track1/9 {_fmt_pct(odds['trackPct'])}")
+    return 0
+
+def _cmd_item(idx, args):
+    buckets = idx.buckets_for_item(args.id)
+    if not buckets:
+        print(f"item not in any bucket: {args.id}", file=sys.stderr)
+        return 1
+
+    for b in buckets:
+        items = idx.bucket(b) or []
+        it = next((x for x in items if x["itemId"] == args.id), None)
+        label = f"  {it['displayName']}  qty {it['qty'] or '—'}" if it else ""
+        print(f"{b}  ({len(items)} items){label}")
+        for rid in idx.rewards_for_bucket(b):
+            print(f"  <- {rid}")
+    return 0
+
+def _cmd_level(idx, args):
+    for notch in (1, 2, 3):
+        d = idx.notch(args.level, notch)
+        print(f"notch {notch}: totalWeight {d['totalWeight']}  {len(d['rewards'])} options")
+        for r in d["rewards"][:args.top] if args.top else d["rewards"]:
+            print(f"  {r['rewardId']:<40} {r['weight']:>6}"
+                  f"  {_fmt_pct(r['percentSingle']):>9}  {_fmt_pct(r['percentAtLeastOneOfThree']):>9}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the PvP binary index without loading data.js.")
+    parser.add_argument("--index", default="data.idx", help="index file (default: data.idx)")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    q = sub.add_parser("query", help="look something up in the index")
+    qsub = q.add_subparsers(dest="kind", required=True)
+
+    qr = qsub.add_parser("reward", help="odds for a RewardID at a track level")
+    qr.add_argument("id")
+    qr.add_argument("level", type=int)
+    qr.add_argument("--player-level", type=int, default=70)
+    qr.set_defaults(func=_cmd_reward)
+
+    qi = qsub.add_parser("item", help="buckets (and direct rewards) that drop an item")
+    qi.add_argument("id")
+    qi.set_defaults(func=_cmd_item)
+
+    ql = qsub.add_parser("level", help="full distribution of a track level")
+    ql.add_argument("level", type=int)
+    ql.add_argument("--top", type=int, default=0, help="only the N most likely rewards per notch")
+    ql.set_defaults(func=_cmd_level)
+
+    args = parser.parse_args(argv)
+
+    try:
+        idx = PvpIndex(args.index)
+    except (OSError, IndexFormatError) as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    with idx:
+        if hasattr(args, "level") and not (0 <= args.level < idx.n_levels):
+            print(f"track level out of range: {args.level} (0..{idx.n_levels - 1})", file=sys.stderr)
+            return 2
+        return args.func(idx, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,578 @@
+import sys
+import json
+import math
+import argparse
+
+import numpy as np
+
+from pvp_index import PvpIndex, IndexFormatError
+
+# --------- Azoth purchase-vs-roll planner
+#
+# Given a budget, the current track level, the owned set and a list of target
+# rewards, find the policy that minimizes the expected cost of collecting all
+# targets, where
+#
+#   cost = azoth spent + levelValue * levels rolled while targets are missing
+#
+# Each level rolls the 3 notches in order; every notch shows 3 independent
+# draws (same model as percentAtLeastOneOfThree) and the player takes at most
+# one target from it. Owned uniques leave the pool (recomputeDistributionAfterFilter),
+# so every target obtained makes the remaining ones more likely.
+# Past `max_level` the track keeps the odds of `max_level` (pvp.js clamps the
+# level there), so the tail is a fixed point, solved exactly rather than
+# cut off at an arbitrary horizon.
+#
+# The DP runs backward over track levels, vectorized over states with numpy
+# (the only third-party dependency, see requirements.txt). To stay
+# interactive on the full unique list it:
+#   - groups targets with identical cost + per-level weights into classes
+#     (state = remaining count per class, not a subset),
+#   - computes the notch odds once per distinct pool, and reuses the tail's
+#     values for every level whose pools match it (one step per other level),
+#   - leaves out of the budget state the classes that are never worth buying
+#     (checked against the unlimited-budget / never-buy bounds), and drops the
+#     budget altogether when it covers everything worth buying,
+#   - snaps the budget down to the largest spend the remaining targets can
+#     actually reach (budgets in between are equivalent).
+
+DRAWS_PER_NOTCH = 3
+MAX_TRACK_LEVEL = 200          # pvp.js clamps the track level to 200
+
+OBJECTIVES = ("cost", "levels")
+# "levels" minimizes expected levels, azoth only breaks ties
+LEVELS_AZOTH_WEIGHT = 1e-9
+
+# states x level steps; ~3 us each, so about 1 s at the limit
+MAX_WORK = 300_000
+# counts x budget cells for the reachable-spend table
+MAX_BUDGET_GRID = 20_000_000
+
+# only Azoth Salt prices can be planned (budget / expected cost are in Azoth)
+AZOTH_CURRENCY = "AzothSalt_Currency"
+
+OUTPUT_PLAN_JS = "plan.js"
+
+
+def _uniq_weights(pvp_data, level, notch, reward_meta, owned):
+    """
+    (totalWeight without owned uniques, {rewardId: weight}) for one notch.
+    """
+    d = pvp_data.get(str(level), {}).get(str(notch)) or {"rewards": []}
+    weights = {}
+    total = 0
+    for r in d["rewards"]:
+        rid = r["rewardId"]
+        if rid in owned and (reward_meta.get(rid) or {}).get("uniqueEligible"):
+            continue
+        weights[rid] = weights.get(rid, 0) + r["weight"]
+        total += r["weight"]
+    return total, weights
+
+
+def plan_purchases(pvp_data, reward_meta, targets, track_level, budget,
+                   owned=(), max_level=MAX_TRACK_LEVEL, objective="cost",
+                   level_value=None, max_work=MAX_WORK):
+    """
+    Solve the buy-vs-roll DP and return a JSON-friendly plan:
+
+      expectedCost / expectedAzoth / expectedLevels   under the optimal policy
+      buyNow            purchases to make right away (in order)
+      targets[]         per target: buyCost, and buyIfLastAt = first level at
+                        which, if it were the only target left, buying beats rolling
+
+    pvp_data / reward_meta have the PVP_DATA / PVP_REWARD_META shapes.
+    Raises ValueError for unknown / unbuyable / non-Azoth targets, or if the state space
+    times the number of level steps exceeds `max_work`.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"objective must be one of {OBJECTIVES}, got {objective!r}")
+    # with levels free, rolling always wins and the plan never buys anything
+    if objective == "cost" and not (level_value is not None and level_value > 0):
+        raise ValueError(f"objective 'cost' needs a level value > 0 (Azoth per level), got {level_value}")
+    if budget < 0:
+        raise ValueError(f"budget must be >= 0, got {budget}")
+
+    owned = set(owned)
+    azoth_w = 1.0 if objective == "cost" else LEVELS_AZOTH_WEIGHT
+    level_w = float(level_value) if objective == "cost" else 1.0
+
+    wanted = []
+    for rid in dict.fromkeys(targets):
+        if rid in owned:
+            continue
+        meta = reward_meta.get(rid)
+        if meta is None:
+            raise ValueError(f"unknown reward: {rid}")
+        cost = meta.get("buyCost")
+        if cost is None:
+            raise ValueError(f"{rid} has no buyCost, it cannot be planned")
+        currency = meta.get("buyCurrency") or ""
+        if currency != AZOTH_CURRENCY:
+            raise ValueError(f"{rid} is priced in {currency or 'an unknown currency'}, "
+                             f"not {AZOTH_CURRENCY}")
+        wanted.append(rid)
+
+    if not wanted:
+        # everything already owned: nothing to roll for, nothing to buy
+        return _plan_dict(track_level, max_level, budget, objective, level_w,
+                          0.0, 0.0, 0.0, [], [], 0)
+
+    levels = list(range(min(track_level, max_level), max_level + 1))
+
+    # per level / notch: total pool weight and each target's weight
+    tables = {}
+    for lvl in levels:
+        tables[lvl] = [_uniq_weights(pvp_data, lvl, n, reward_meta, owned) for n in (1, 2, 3)]
+
+    # --- classes of interchangeable targets
+    class_of_key = {}
+    classes = []     # {cost, unique, members, w: {(lvl, notch): weight}}
+    for rid in wanted:
+        meta = reward_meta[rid]
+        w = tuple(tables[lvl][n][1].get(rid, 0) for lvl in levels for n in range(3))
+        key = (int(meta["buyCost"]), bool(meta.get("uniqueEligible")), w)
+        if key not in class_of_key:
+            class_of_key[key] = len(classes)
+            classes.append({
+                "cost": key[0],
+                "unique": key[1],
+                "members": [],
+                "w": {(lvl, n): w[i * 3 + n] for i, lvl in enumerate(levels) for n in range(3)},
+            })
+        classes[class_of_key[key]]["members"].append(rid)
+
+    n_cls = len(classes)
+
+    # --- notch pools per level, as weight keys (memoized below)
+    level_keys = [
+        tuple((tables[lvl][n][0],) + tuple(cls["w"][(lvl, n)] for cls in classes) for n in range(3))
+        for lvl in levels
+    ]
+
+    # Levels below max_level only need a step of their own if their pools
+    # differ from the tail; the rest share the tail's fixed point.
+    steps = 0
+    for i in range(len(levels) - 2, -1, -1):
+        if level_keys[i] != level_keys[-1]:
+            steps = i + 1
+            break
+
+    # size check in Python ints, before anything is allocated
+    n_counts = math.prod(len(c["members"]) + 1 for c in classes)
+    if n_counts * (steps + 1) > max_work:
+        raise ValueError(
+            f"plan too large: {n_counts} target combinations x {steps + 1} level steps; "
+            f"use fewer targets"
+        )
+
+    k0 = np.array([len(c["members"]) for c in classes], dtype=np.int64)
+    costs = np.array([c["cost"] for c in classes], dtype=np.int64)
+    unique = np.array([c["unique"] for c in classes], dtype=bool)
+
+    # --- remaining counts per class, as a mixed-radix index
+    radix = np.cumprod(np.concatenate(([1], k0 + 1)))[:-1].astype(np.int64)
+    counts = (np.arange(n_counts)[:, None] // radix) % (k0 + 1)
+    remcost = (counts @ costs).astype(float)
+    left = counts.sum(axis=1)
+
+    # --- notch odds, once per distinct pool
+    pool_of_key = {}
+    pools = []           # (p[c] = chance one draw is a class c target, miss = no target in k draws)
+    level_pools = []     # per level: pool ids of notch 1..3
+
+    for keys in level_keys:
+        ids = []
+        for key in keys:
+            if key not in pool_of_key:
+                pool_of_key[key] = len(pools)
+                pools.append(_pool_odds(key[0], np.array(key[1:], dtype=float), counts, k0, unique))
+            ids.append(pool_of_key[key])
+        level_pools.append(tuple(ids))
+
+    def pool_tabs(st_ci):
+        return [(p[:, st_ci], miss[st_ci]) for p, miss in pools]
+
+    # --- bounds on the counts alone: unlimited budget (lower) / never buy (upper).
+    # Buying c in a state is never strictly better than rolling when
+    #   cost_c + lower(after the buy) >= upper(now)
+    # so a class for which that holds everywhere is left out of the budget state.
+    all_ci = np.arange(n_counts)
+    has = [np.nonzero(counts[:, c])[0] for c in range(n_cls)]
+    rn_counts = np.array([np.where(counts[:, c] > 0, all_ci - radix[c], all_ci)
+                          for c in range(n_cls)]).reshape(n_cls, n_counts)
+    buy_all = [(c, has[c], has[c] - radix[c]) for c in range(n_cls)]
+
+    useful = np.zeros(n_cls, dtype=bool)
+    if budget >= costs.min(initial=budget + 1):
+        tabs = pool_tabs(all_ci)
+        lower = _solve(levels, level_pools, tabs, left, rn_counts, buy_all, costs,
+                       remcost, azoth_w, level_w)
+        upper = _solve(levels, level_pools, tabs, left, rn_counts, [], costs,
+                       remcost, azoth_w, level_w)
+        seen = None
+        for (_, lo_az, lo_lv, _), (_, hi_az, hi_lv, _) in zip(lower, upper):
+            if lo_az is seen:
+                continue    # same arrays as the level above
+            seen = lo_az
+            lo = azoth_w * lo_az + level_w * lo_lv
+            hi = azoth_w * hi_az + level_w * hi_lv
+            for c, src, dst in buy_all:
+                if not useful[c] and costs[c] <= budget:
+                    useful[c] = bool(np.any(azoth_w * costs[c] + lo[dst] < hi[src] - 1e-9))
+
+    # --- state space: counts x budget, the budget snapped down to the largest
+    # spend the remaining useful targets can reach (budgets in between are equivalent)
+    u_cls = np.nonzero(useful)[0]
+    u_total = int((k0[u_cls] * costs[u_cls]).sum())
+
+    if len(u_cls) == 0 or budget >= u_total:
+        # nothing worth buying, or enough azoth for all of it: counts only
+        st_ci = all_ci
+        rn = rn_counts
+        buy = [buy_all[c] for c in u_cls]
+        start = n_counts - 1
+        last_of = {int(c): int(radix[c]) for c in u_cls}
+    else:
+        unit = int(np.gcd.reduce(costs[u_cls]))
+        width = int(budget) // unit + 1
+        u_radix = np.cumprod(np.concatenate(([1], k0[u_cls] + 1)))[:-1].astype(np.int64)
+        n_u = int(np.prod(k0[u_cls] + 1))
+        if n_u * width > MAX_BUDGET_GRID:
+            raise ValueError(f"plan too large: budget grid {n_u} x {width}; "
+                             f"use fewer targets or a smaller budget")
+        u_of_ci = counts[:, u_cls] @ u_radix
+        u_counts = (np.arange(n_u)[:, None] // u_radix) % (k0[u_cls] + 1)
+
+        # reachable spends per useful-count combination, then "largest <= b"
+        reach = np.zeros((n_u, width), dtype=bool)
+        reach[:, 0] = True
+        for j, c in enumerate(u_cls):
+            before = reach.copy()
+            step = int(costs[c]) // unit
+            for m in range(1, int(k0[c]) + 1):
+                sh = m * step
+                if sh >= width:
+                    break
+                rows = u_counts[:, j] >= m
+                reach[rows, sh:] |= before[rows, :width - sh]
+        snap = np.maximum.accumulate(np.where(reach, np.arange(width), 0), axis=1)
+
+        def canon(ci, bu):
+            return snap[u_of_ci[ci], bu]
+
+        # discover reachable states layer by layer (one target fewer per step)
+        c_units = costs // unit
+        layer_ci = np.array([n_counts - 1])
+        layer_bu = canon(layer_ci, np.array([width - 1]))
+        all_keys = []
+        while len(layer_ci):
+            all_keys.append(layer_ci * width + layer_bu)
+            nxt_ci, nxt_bu = [], []
+            for c in range(n_cls):
+                m = counts[layer_ci, c] > 0
+                ci = layer_ci[m] - radix[c]
+                nxt_ci.append(ci)
+                nxt_bu.append(canon(ci, layer_bu[m]))
+                if useful[c]:
+                    m = m & (layer_bu >= c_units[c])
+                    ci = layer_ci[m] - radix[c]
+                    nxt_ci.append(ci)
+                    nxt_bu.append(canon(ci, layer_bu[m] - c_units[c]))
+            keys = np.unique(np.concatenate(nxt_ci) * width + np.concatenate(nxt_bu))
+            layer_ci, layer_bu = keys // width, keys % width
+        keys = np.sort(np.concatenate(all_keys))
+        st_ci, st_bu = keys // width, keys % width
+
+        def find(ci, bu):
+            return np.searchsorted(keys, ci * width + canon(ci, bu))
+
+        if len(keys) * (steps + 1) > max_work:
+            raise ValueError(
+                f"plan too large: {len(keys)} states x {steps + 1} level steps; "
+                f"use fewer targets or a smaller budget"
+            )
+        idx = np.arange(len(keys))
+        rn = np.empty((n_cls, len(keys)), dtype=np.int64)
+        buy = []
+        for c in range(n_cls):
+            m = counts[st_ci, c] > 0
+            rn[c] = idx
+            rn[c, m] = find(st_ci[m] - radix[c], st_bu[m])
+            if useful[c]:
+                src = np.nonzero(m & (st_bu >= c_units[c]))[0]
+                buy.append((c, src, find(st_ci[src] - radix[c], st_bu[src] - c_units[c])))
+        start = int(find(np.array([n_counts - 1]), np.array([width - 1]))[0])
+        # "only this target left, budget untouched"
+        last_of = {int(c): int(find(np.array([radix[c]]), np.array([width - 1]))[0])
+                   for c in u_cls}
+
+    n_states = len(st_ci)
+    if n_states * (steps + 1) > max_work:
+        raise ValueError(
+            f"plan too large: {n_states} states x {steps + 1} level steps; "
+            f"use fewer targets or a smaller budget"
+        )
+
+    # --- the DP itself
+    buy_if_last = [None] * n_cls
+    for lvl, az, lv, act in _solve(levels, level_pools, pool_tabs(st_ci), left[st_ci],
+                                   rn, buy, costs, remcost[st_ci], azoth_w, level_w):
+        # single-target thresholds ("buy it if it's the last one missing at this level")
+        for c, s in last_of.items():
+            if act[s] == c:
+                buy_if_last[c] = lvl
+
+    # --- purchases to make now: follow the policy at the start level
+    buy_now = []
+    s = start
+    bought = [0] * n_cls
+    buy_of = {c: (src, dst) for c, src, dst in buy}
+    while act[s] >= 0:
+        c = int(act[s])
+        buy_now.append(classes[c]["members"][bought[c]])
+        bought[c] += 1
+        src, dst = buy_of[c]
+        s = int(dst[np.searchsorted(src, s)])
+
+    targets_out = []
+    for c, cls in enumerate(classes):
+        for rid in cls["members"]:
+            targets_out.append({
+                "rewardId": rid,
+                "buyCost": cls["cost"],
+                "buyIfLastAt": buy_if_last[c],
+            })
+
+    return _plan_dict(track_level, max_level, budget, objective, level_w,
+                      float(azoth_w * az[start] + level_w * lv[start]),
+                      float(az[start]), float(lv[start]), buy_now, targets_out, n_states)
+
+
+def _plan_dict(track_level, max_level, budget, objective, level_w,
+               cost, azoth, levels, buy_now, targets, n_states):
+    return {
+        "trackLevel": track_level,
+        "maxLevel": max_level,
+        "budget": int(budget),
+        "objective": objective,
+        "levelValue": level_w if objective == "cost" else None,
+        "expectedCost": cost,
+        "expectedAzoth": azoth,
+        "expectedLevels": levels,
+        "buyNow": buy_now,
+        "targets": targets,
+        "states": n_states,
+    }
+
+
+# --------- DP helpers (vectorized over states)
+
+def _pool_odds(base, ws, counts, k0, unique):
+    """
+    Per counts index: p[c] = chance one draw is a class c target, and the
+    chance that none of the k draws is a target. Owned-by-now uniques are out.
+    """
+    tot = base - ((k0 - counts) * (ws * unique)).sum(axis=1)
+    safe = np.where(tot > 0, tot, 1)[:, None]
+    p = np.where(tot[:, None] > 0, counts * ws / safe, 0.0)
+    miss = np.clip(1 - p.sum(axis=1), 0, None) ** DRAWS_PER_NOTCH
+    return p.T.copy(), miss
+
+
+def _notch(w_az, w_lv, p, nxt, azoth_w, level_w):
+    """
+    Expected value of the target part of one notch: the best target on show
+    is taken, P(c is taken) = (1-A)^k - (1-A-p_c)^k with A = mass of the
+    targets worth more than c. Add miss * (value of staying) for the full notch.
+    """
+    g_az, g_lv = w_az[nxt], w_lv[nxt]
+    order = np.argsort(azoth_w * g_az + level_w * g_lv, axis=0, kind="stable")
+    p = np.take_along_axis(p, order, axis=0)
+    above = np.cumsum(p, axis=0) - p
+    k = DRAWS_PER_NOTCH
+    take = (1 - above) ** k - np.clip(1 - above - p, 0, None) ** k
+    return ((take * np.take_along_axis(g_az, order, axis=0)).sum(axis=0),
+            (take * np.take_along_axis(g_lv, order, axis=0)).sum(axis=0))
+
+
+def _layers(left, buy):
+    """
+    States grouped by targets left (rolls and buys only go to lower layers),
+    and the buy edges split the same way: [(class, position in layer, state after)].
+    """
+    layers = [np.nonzero(left == t)[0] for t in range(int(left.max(initial=0)) + 1)]
+    pos = np.empty(len(left), dtype=np.int64)
+    for states in layers:
+        pos[states] = np.arange(len(states))
+    buy_layers = [[] for _ in layers]
+    for c, src, dst in buy:
+        t_src = left[src]
+        for t in np.unique(t_src):
+            m = t_src == t
+            buy_layers[t].append((c, pos[src[m]], dst[m]))
+    return layers, buy_layers
+
+
+def _buy_min(cur_az, cur_lv, edges, v_az, v_lv, costs, azoth_w, level_w):
+    """Roll (cur_*) vs buying first, in place; returns the class bought (-1 = roll)."""
+    act = np.full(len(cur_az), -1, dtype=np.int8)
+    if not edges:
+        return act
+    j = azoth_w * cur_az + level_w * cur_lv
+    for c, pos, dst in edges:
+        c_az = costs[c] + v_az[dst]
+        c_lv = v_lv[dst]
+        c_j = azoth_w * c_az + level_w * c_lv
+        better = c_j < j[pos] - 1e-9
+        if better.any():
+            at = pos[better]
+            cur_az[at] = c_az[better]
+            cur_lv[at] = c_lv[better]
+            j[at] = c_j[better]
+            act[at] = c
+    return act
+
+
+def _stationary(tabs, layers, buy_layers, rn, fallback_az, costs, azoth_w, level_w):
+    """
+    Values at the start of a level whose odds repeat forever (past max_level).
+    A state only leads to itself (no target in the level) or to states with
+    fewer targets, so going up the layers each value comes out directly:
+      roll = (A + 1 level) / (1 - P(no target in the 3 notches))
+    with A = the part where a target is taken. If no target can show up
+    anymore, what is left is bought at full price (outside the budget).
+    """
+    n = len(fallback_az)
+    v_az, v_lv = np.zeros(n), np.zeros(n)
+    w3_az, w3_lv = np.zeros(n), np.zeros(n)    # after notch 3 / before notch 3
+    w2_az, w2_lv = np.zeros(n), np.zeros(n)
+    act = np.full(n, -1, dtype=np.int8)
+    (p1, m1), (p2, m2), (p3, m3) = tabs
+
+    for states, edges in zip(layers, buy_layers):
+        nx = rn[:, states]
+        a3 = _notch(v_az, v_lv, p3[:, states], nx, azoth_w, level_w)
+        a2 = _notch(w3_az, w3_lv, p2[:, states], nx, azoth_w, level_w)
+        a1 = _notch(w2_az, w2_lv, p1[:, states], nx, azoth_w, level_w)
+        q1, q2, q3 = m1[states], m2[states], m3[states]
+        stay = q1 * q2 * q3
+        a_az = a1[0] + q1 * (a2[0] + q2 * a3[0])
+        a_lv = a1[1] + q1 * (a2[1] + q2 * a3[1])
+
+        moving = stay < 1
+        go = np.where(moving, 1 - stay, 1)
+        cur_az = np.where(moving, a_az / go, fallback_az[states])
+        cur_lv = np.where(moving, (a_lv + 1) / go, 0.0)
+        act[states] = _buy_min(cur_az, cur_lv, edges, v_az, v_lv, costs, azoth_w, level_w)
+
+        v_az[states], v_lv[states] = cur_az, cur_lv
+        w3_az[states] = a3[0] + q3 * cur_az
+        w3_lv[states] = a3[1] + q3 * cur_lv
+        w2_az[states] = a2[0] + q2 * w3_az[states]
+        w2_lv[states] = a2[1] + q2 * w3_lv[states]
+    return v_az, v_lv, act
+
+
+def _solve(levels, level_pools, tabs, left, rn, buy, costs, fallback_az, azoth_w, level_w):
+    """
+    Backward DP over `levels`. Yields (level, azoth, levels, action) at the
+    start of each level, from the last level down; action[s] = class bought
+    first in state s, or -1 to roll. Past the last level the track keeps its
+    odds (see _stationary); levels with the same pools as the tail yield the
+    very same arrays.
+
+      tabs[pool id]  (p, miss) per state
+      left           targets left per state
+      rn[c]          state after getting one of class c (itself if none left)
+      buy            [(class, states that can buy it, state after the buy)]
+    """
+    layers, buy_layers = _layers(left, buy)
+    tail = level_pools[-1]
+    az, lv, act = _stationary([tabs[pid] for pid in tail], layers, buy_layers, rn,
+                              fallback_az, costs, azoth_w, level_w)
+    rolling = (left > 0).astype(float)
+    on_tail = True
+
+    for i in range(len(levels) - 1, -1, -1):
+        if i < len(levels) - 1 and not (on_tail and level_pools[i] == tail):
+            on_tail = False
+            # roll: notch 3 -> 2 -> 1, each one from the next notch's values
+            w_az, w_lv = az, lv
+            for pid in reversed(level_pools[i]):
+                p, miss = tabs[pid]
+                t_az, t_lv = _notch(w_az, w_lv, p, rn, azoth_w, level_w)
+                w_az, w_lv = t_az + miss * w_az, t_lv + miss * w_lv
+            az, lv = w_az, w_lv + rolling
+            # then roll vs buy, lowest layers first (buys lead there)
+            act = np.full(len(az), -1, dtype=np.int8)
+            for states, edges in zip(layers, buy_layers):
+                cur_az, cur_lv = az[states], lv[states]
+                act[states] = _buy_min(cur_az, cur_lv, edges, az, lv, costs, azoth_w, level_w)
+                az[states], lv[states] = cur_az, cur_lv
+        yield levels[i], az, lv, act
+
+
+def write_plan_js(path, plan):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("window.PVP_PLAN=" + json.dumps(plan, separators=(",", ":")) + ";\n")
+
+
+# --------- CLI
+
+def _load_from_index(index_path, ids, track_level, max_level):
+    """PVP_DATA / PVP_REWARD_META subsets straight from data.idx."""
+    with PvpIndex(index_path) as idx:
+        if not (0 <= track_level < idx.n_levels):
+            raise ValueError(f"track level out of range: {track_level} (0..{idx.n_levels - 1})")
+        last = min(max_level, idx.n_levels - 1)
+        pvp_data = {
+            str(lvl): {str(n): idx.notch(lvl, n) for n in (1, 2, 3)}
+            for lvl in range(min(track_level, last), last + 1)
+        }
+        reward_meta = {}
+        for rid in ids:
+            meta = idx.reward(rid)
+            if meta is not None:
+                reward_meta[rid] = meta
+    return pvp_data, reward_meta, last
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Plan Azoth purchases vs rolling the PvP track.")
+    parser.add_argument("--index", default="data.idx", help="index file (default: data.idx)")
+    parser.add_argument("--level", type=int, required=True, help="current track level")
+    parser.add_argument("--budget", type=int, required=True, help="Azoth Salt available now")
+    parser.add_argument("--targets", nargs="+", required=True, metavar="REWARD_ID")
+    parser.add_argument("--owned", nargs="*", default=[], metavar="REWARD_ID")
+    parser.add_argument("--max-level", type=int, default=MAX_TRACK_LEVEL)
+    parser.add_argument("--objective", choices=OBJECTIVES, default="cost")
+    parser.add_argument("--level-value", type=float,
+                        help="Azoth one track level is worth to you (required for objective=cost)")
+    parser.add_argument("--out", help=f"also write the plan as a page script (e.g. {OUTPUT_PLAN_JS})")
+    args = parser.parse_args(argv)
+    if args.objective == "cost" and args.level_value is None:
+        parser.error("--level-value is required with --objective cost")
+
+    try:
+        pvp_data, reward_meta, max_level = _load_from_index(
+            args.index, list(args.targets) + list(args.owned), args.level, args.max_level
+        )
+        plan = plan_purchases(
+            pvp_data, reward_meta, args.targets, args.level, args.budget,
+            owned=args.owned, max_level=max_level, objective=args.objective,
+            level_value=args.level_value,
+        )
+    except (OSError, IndexFormatError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    if args.out:
+        write_plan_js(args.out, plan)
+        print("OK ->", args.out)
+    print(json.dumps(plan, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())